@@ -1,23 +1,3 @@
-from __future__ import annotations
-
-import json
-import logging
-import os
-import re
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Optional
-
-from dotenv import dotenv_values
-
-from kmi_manager_cli.config import validate_base_url
-
-try:
-    import tomllib
-except ModuleNotFoundError:  # pragma: no cover - py<3.11 fallback
-    import tomli as tomllib
-
-
 """Authentication account loading from multiple file formats.
 
 This module parses auth files in .env, .toml, .json, and .json.bak formats,
@@ -29,6 +9,7 @@ Key Components:
     load_accounts_from_auths_dir: Scans directory and loads all accounts
     load_current_account: Loads the active account from ~/.kimi/config.toml
     copy_account_config: Copies selected auth to Kimi CLI config
+    read_env_values: Minimal KEY=VALUE reader for auth .env files
 
 File Format Support:
     .env: KEY=VALUE format with KMI_API_KEY, KMI_KEY_LABEL, etc.
@@ -47,6 +28,23 @@ Email Extraction:
     in health dashboards.
 """
 
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from kmi_manager_cli.config import validate_base_url
+from kmi_manager_cli.locking import atomic_write_private_text
+
 
 @dataclass
 class Account:
@@ -58,14 +56,24 @@ class Account:
     email: Optional[str] = None
 
 
-_PROVIDER_ORDER = ["managed:kimi-code", "kimi-for-coding", "moonshot-ai"]
-_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+_MANIFEST_VERSION = 1
+_PARALLEL_PARSE_THRESHOLD = 8
+_LOADED_ACCOUNTS_MAX = 4
+# Auth configs are a few hundred bytes; anything this large is not one.
+_MAX_AUTH_FILE_BYTES = 1 << 20
+# Editor swap files and leftovers from copy_account_config/atomic writes.
+_SKIPPED_SUFFIXES = (".tmp", ".swp", "~")
+_PROVIDER_ORDER = ("managed:kimi-code", "kimi-for-coding", "moonshot-ai")
+# Bounded per RFC 5321 lengths so long runs without "@" fail fast.
+_EMAIL_RE = re.compile(
+    r"[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Za-z]{2,24}", re.ASCII
+)
+# Strips a trailing "config" suffix and any separators left before/after it.
+_LABEL_SUFFIX_RE = re.compile(r"(?:[_-]*config|[_-]+)$", re.IGNORECASE)
 
 
 def _normalize_label(label: str) -> str:
-    value = label.strip()
-    value = re.sub(r"([_-]?config)$", "", value, flags=re.IGNORECASE)
-    value = re.sub(r"[_-]+$", "", value)
+    value = _LABEL_SUFFIX_RE.sub("", label.strip())
     return value or label
 
 
@@ -92,12 +100,48 @@ def _normalize_base_url(
         return None
 
 
-def _parse_toml(path: Path) -> dict:
+@functools.lru_cache(maxsize=256)
+def _read_toml_cached(path_str: str, mtime_ns: int, size: int) -> tuple[dict, str]:
     try:
-        with path.open("rb") as handle:
-            return tomllib.load(handle)
-    except (OSError, ValueError):
-        return {}
+        import tomllib
+    except ModuleNotFoundError:  # pragma: no cover - py<3.11 fallback
+        import tomli as tomllib
+
+    try:
+        data = Path(path_str).read_bytes()
+    except OSError:
+        return {}, ""
+    text = data.decode("utf-8", errors="ignore")
+    try:
+        return tomllib.loads(data.decode("utf-8")), text
+    except ValueError:
+        return {}, text
+
+
+def _read_toml(path: Path) -> tuple[dict, str]:
+    """Parse a TOML file and return ``(config, raw_text)``.
+
+    The file is read once and both values are reused while its (mtime, size)
+    are unchanged; the returned dict is shared and must be treated as read-only.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return {}, ""
+    return _read_toml_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _parse_toml(path: Path) -> dict:
+    return _read_toml(path)[0]
+
+
+def _string_values(values: dict) -> dict[str, str]:
+    # TOML keys and most values are already str; only convert the rest.
+    return {
+        k if isinstance(k, str) else str(k): v if isinstance(v, str) else str(v)
+        for k, v in values.items()
+        if v is not None
+    }
 
 
 def _providers_from_config(config: dict) -> dict[str, dict[str, str]]:
@@ -106,17 +150,13 @@ def _providers_from_config(config: dict) -> dict[str, dict[str, str]]:
     if isinstance(root, dict):
         for name, values in root.items():
             if isinstance(values, dict):
-                providers[str(name)] = {
-                    str(k): str(v) for k, v in values.items() if v is not None
-                }
+                providers[str(name)] = _string_values(values)
     for section, values in config.items() if isinstance(config, dict) else []:
         if not isinstance(section, str) or not section.startswith("providers."):
             continue
         name = _normalize_name(section.split(".", 1)[1])
         if isinstance(values, dict):
-            providers[name] = {
-                str(k): str(v) for k, v in values.items() if v is not None
-            }
+            providers[name] = _string_values(values)
     return providers
 
 
@@ -124,12 +164,13 @@ def _select_provider(
     providers: dict[str, dict[str, str]],
 ) -> Optional[tuple[str, dict[str, str]]]:
     for name in _PROVIDER_ORDER:
-        if name in providers and providers[name].get("api_key"):
-            return name, providers[name]
-    for name, values in providers.items():
-        if values.get("api_key"):
+        values = providers.get(name)
+        if values is not None and values.get("api_key"):
             return name, values
-    return None
+    return next(
+        ((name, values) for name, values in providers.items() if values.get("api_key")),
+        None,
+    )
 
 
 def _extract_email_from_values(values: dict[str, str]) -> Optional[str]:
@@ -142,33 +183,36 @@ def _extract_email_from_values(values: dict[str, str]) -> Optional[str]:
         "account",
     ):
         value = values.get(key)
-        if value and _EMAIL_RE.search(str(value)):
-            return _EMAIL_RE.search(str(value)).group(0)
-    for value in values.values():
-        if value and _EMAIL_RE.search(str(value)):
-            return _EMAIL_RE.search(str(value)).group(0)
-    return None
+        if value and (email := _extract_email_from_text(str(value))):
+            return email
+    # One scan over all values: the separator can't be part of a match, so the
+    # leftmost match is the same one a per-value loop would return first.
+    return _extract_email_from_text(" ".join(str(v) for v in values.values() if v))
 
 
-def _extract_email_from_config(config: dict) -> Optional[str]:
+def _iter_config_tables(config: dict) -> Iterator[dict]:
+    # Stack order: a table comes before its sub-tables, and the last-listed
+    # sub-table is visited first. This fixes which email wins when several
+    # tables have one, so it must not change.
     stack = [config]
     while stack:
         current = stack.pop()
-        if not isinstance(current, dict):
-            continue
-        values = {
-            k: str(v) for k, v in current.items() if isinstance(v, (str, int, float))
-        }
-        email = _extract_email_from_values(values)
-        if email:
+        yield current
+        stack.extend(value for value in current.values() if isinstance(value, dict))
+
+
+def _extract_email_from_config(config: dict) -> Optional[str]:
+    for table in _iter_config_tables(config):
+        scalars = {k: v for k, v in table.items() if isinstance(v, (str, int, float))}
+        if email := _extract_email_from_values(scalars):
             return email
-        for value in current.values():
-            if isinstance(value, dict):
-                stack.append(value)
     return None
 
 
 def _extract_email_from_text(text: str) -> Optional[str]:
+    # Cheap substring check first: most config values never contain "@".
+    if "@" not in text:
+        return None
     match = _EMAIL_RE.search(text)
     if match:
         return match.group(0)
@@ -178,7 +222,7 @@ def _extract_email_from_text(text: str) -> Optional[str]:
 def _account_from_toml(
     path: Path, default_base_url: str, allowlist: tuple[str, ...]
 ) -> Optional[Account]:
-    config = _parse_toml(path)
+    config, text = _read_toml(path)
     providers = _providers_from_config(config)
     selected = _select_provider(providers)
     if not selected:
@@ -197,9 +241,7 @@ def _account_from_toml(
     if email is None:
         email = _extract_email_from_config(config)
     if email is None:
-        email = _extract_email_from_text(path.name) or _extract_email_from_text(
-            path.read_text(errors="ignore")
-        )
+        email = _extract_email_from_text(f"{path.name}\n{text}")
     return Account(
         id=f"auth:{path.name}",
         label=label,
@@ -210,10 +252,64 @@ def _account_from_toml(
     )
 
 
+# Same quoting rules as python-dotenv: a quoted value may be followed by an
+# inline comment; unquoted values drop anything after whitespace + "#".
+_ENV_QUOTED_VALUE = re.compile(r"""(['"])((?:\\.|(?!\1).)*)\1[ \t]*(?:#.*)?""")
+_ENV_INLINE_COMMENT = re.compile(r"\s+#.*")
+_ENV_DOUBLE_QUOTE_ESCAPES = re.compile(r"""\\[\\'"abfnrtv]""")
+_ENV_SINGLE_QUOTE_ESCAPES = re.compile(r"\\[\\']")
+
+
+def _decode_escape(match: re.Match) -> str:
+    return match.group(0).encode("ascii").decode("unicode-escape")
+
+
+def _parse_env_value(value: str) -> Optional[str]:
+    """Return the value of an env line, or ``None`` if its quoting is broken."""
+    if not value or value[0] not in "\"'":
+        return _ENV_INLINE_COMMENT.sub("", value).rstrip()
+    match = _ENV_QUOTED_VALUE.fullmatch(value)
+    if match is None:
+        return None
+    quote, inner = match.group(1), match.group(2)
+    if quote == '"':
+        return _ENV_DOUBLE_QUOTE_ESCAPES.sub(_decode_escape, inner)
+    return _ENV_SINGLE_QUOTE_ESCAPES.sub(lambda m: m.group(0)[1], inner)
+
+
+def read_env_values(path: Path) -> dict[str, str]:
+    """Read KEY=VALUE pairs from an auth .env file.
+
+    Supports comments, an optional ``export`` prefix and single/double quoted
+    values with escapes and trailing comments; variable interpolation and
+    multiline values are not needed for auth files and are not supported.
+    Lines with unbalanced quotes are skipped, as python-dotenv does.
+    """
+    try:
+        text = path.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return {}
+    values: dict[str, str] = {}
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export ") :].lstrip()
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            continue
+        parsed = _parse_env_value(value.strip())
+        if parsed is not None:
+            values[key] = parsed
+    return values
+
+
 def _account_from_env(
     path: Path, default_base_url: str, allowlist: tuple[str, ...]
 ) -> Optional[Account]:
-    data = dotenv_values(path)
+    data = read_env_values(path)
     api_key = data.get("KMI_API_KEY")
     if not api_key:
         return None
@@ -226,8 +322,7 @@ def _account_from_env(
     email = None
     for key in ("KMI_ACCOUNT_EMAIL", "KMI_EMAIL", "EMAIL"):
         value = data.get(key)
-        if value and _EMAIL_RE.search(str(value)):
-            email = _EMAIL_RE.search(str(value)).group(0)
+        if value and (email := _extract_email_from_text(str(value))):
             break
     if email is None:
         email = _extract_email_from_values(
@@ -290,45 +385,197 @@ def _account_from_json(
     )
 
 
-def collect_auth_files(auths_dir: Path) -> list[Path]:
+def _skip_auth_entry(entry: os.DirEntry) -> bool:
+    name = entry.name
+    return name.startswith(".") or name.endswith(_SKIPPED_SUFFIXES)
+
+
+def _auth_file_entry(entry: os.DirEntry) -> bool:
+    if _skip_auth_entry(entry) or not entry.is_file():
+        return False
+    try:
+        return entry.stat().st_size <= _MAX_AUTH_FILE_BYTES
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=8)
+def _collect_auth_files_cached(
+    root: str, mtime_ns: int, child_sig: tuple[tuple[str, int], ...]
+) -> tuple[Path, ...]:
     candidates: list[Path] = []
-    for path in sorted(auths_dir.iterdir()):
-        if path.is_dir():
-            candidates.extend(sorted([p for p in path.iterdir() if p.is_file()]))
-        elif path.is_file():
-            candidates.append(path)
-    return candidates
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        if _skip_auth_entry(entry):
+            continue
+        if entry.is_dir():
+            with os.scandir(entry.path) as sub:
+                nested = sorted(
+                    (child for child in sub if _auth_file_entry(child)),
+                    key=lambda child: child.name,
+                )
+            candidates.extend(Path(child.path) for child in nested)
+        elif _auth_file_entry(entry):
+            candidates.append(Path(entry.path))
+    return tuple(candidates)
+
+
+def collect_auth_files(auths_dir: Path) -> list[Path]:
+    """List auth files in ``auths_dir`` and its immediate subdirectories.
+
+    Hidden entries, editor/temp leftovers and files over 1 MiB are skipped.
+
+    Directory mtimes change whenever entries are added, removed or renamed,
+    so the listing is cached on the mtimes of the root and each subdirectory.
+    """
+    root = str(auths_dir)
+    mtime_ns = os.stat(root).st_mtime_ns
+    with os.scandir(root) as it:
+        child_sig = tuple(
+            sorted(
+                (entry.name, entry.stat().st_mtime_ns) for entry in it if entry.is_dir()
+            )
+        )
+    return list(_collect_auth_files_cached(root, mtime_ns, child_sig))
+
+
+_AccountLoader = Callable[[Path, str, tuple[str, ...]], Optional[Account]]
+_ACCOUNT_LOADERS: dict[str, _AccountLoader] = {
+    ".env": _account_from_env,
+    ".toml": _account_from_toml,
+    ".json": _account_from_json,
+    ".bak": _account_from_json,
+}
+
+
+def _account_loader(path: Path) -> Optional[_AccountLoader]:
+    loader = _ACCOUNT_LOADERS.get(path.suffix.lower())
+    if loader is None and path.name.endswith(".json.bak"):
+        return _account_from_json
+    return loader
+
+
+def accounts_manifest_path(state_dir: Path) -> Path:
+    return state_dir.expanduser() / "cache" / "accounts.json"
+
+
+def _auths_signature(
+    files: list[Path], default_base_url: str, allowlist: tuple[str, ...]
+) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        repr((_MANIFEST_VERSION, default_base_url, tuple(allowlist))).encode("utf-8")
+    )
+    for path in files:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _read_manifest(path: Path, signature: str) -> Optional[list[Account]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("signature") != signature:
+        return None
+    items = payload.get("accounts")
+    if not isinstance(items, list):
+        return None
+    try:
+        return [Account(**item) for item in items]
+    except TypeError:
+        return None
+
+
+def _write_manifest(path: Path, signature: str, accounts: list[Account]) -> None:
+    payload = {
+        "signature": signature,
+        "accounts": [asdict(account) for account in accounts],
+    }
+    try:
+        # The manifest holds API keys, so keep it owner-only like the auth files.
+        atomic_write_private_text(path, json.dumps(payload, ensure_ascii=True) + "\n")
+    except OSError:
+        return
 
 
 def load_accounts_from_auths_dir(
-    auths_dir: Path, default_base_url: str, allowlist: tuple[str, ...] = ()
+    auths_dir: Path,
+    default_base_url: str,
+    allowlist: tuple[str, ...] = (),
+    manifest_path: Optional[Path] = None,
 ) -> list[Account]:
+    """Load accounts from every auth file under ``auths_dir``.
+
+    Results are memoised in-process on a signature of the auth files (path,
+    mtime, size) and the base URL settings, so repeated calls within one
+    command reuse them. When ``manifest_path`` is given, the accounts are also
+    persisted there; later processes with an unchanged signature skip parsing.
+    """
     auths_dir = auths_dir.expanduser()
     if not auths_dir.exists():
         return []
-    accounts: list[Account] = []
-    for path in collect_auth_files(auths_dir):
-        if path.suffix.lower() == ".env":
-            account = _account_from_env(path, default_base_url, allowlist)
-        elif path.suffix.lower() == ".toml":
-            account = _account_from_toml(path, default_base_url, allowlist)
-        elif path.suffix.lower() in {".json", ".bak"} or path.name.endswith(
-            ".json.bak"
-        ):
-            account = _account_from_json(path, default_base_url, allowlist)
-        else:
-            account = None
-        if account:
-            accounts.append(account)
+    files = collect_auth_files(auths_dir)
+    signature = _auths_signature(files, default_base_url, allowlist)
+    loaded = _loaded_accounts.get(signature)
+    if loaded is not None:
+        return list(loaded)
+    if manifest_path is not None:
+        cached = _read_manifest(manifest_path, signature)
+        if cached is not None:
+            _remember_accounts(signature, cached)
+            return cached
+    jobs = [(path, loader) for path in files if (loader := _account_loader(path))]
+
+    def run(job: tuple[Path, _AccountLoader]) -> Optional[Account]:
+        path, loader = job
+        return loader(path, default_base_url, allowlist)
+
+    if len(jobs) > _PARALLEL_PARSE_THRESHOLD:
+        # Files are independent; map() keeps results in input order.
+        with ThreadPoolExecutor(max_workers=min(32, len(jobs))) as executor:
+            results = list(executor.map(run, jobs))
+    else:
+        results = [run(job) for job in jobs]
+    accounts = [account for account in results if account]
+    if manifest_path is not None:
+        _write_manifest(manifest_path, signature, accounts)
+    _remember_accounts(signature, accounts)
     return accounts
 
 
+_loaded_accounts: dict[str, tuple[Account, ...]] = {}
+
+
+def _remember_accounts(signature: str, accounts: list[Account]) -> None:
+    if len(_loaded_accounts) >= _LOADED_ACCOUNTS_MAX:
+        _loaded_accounts.pop(next(iter(_loaded_accounts)))
+    _loaded_accounts[signature] = tuple(accounts)
+
+
 def load_current_account(
     config_path: Path, allowlist: tuple[str, ...] = ()
 ) -> Optional[Account]:
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except OSError:
         return None
-    config = _parse_toml(config_path)
+    return _load_current_account_cached(
+        str(config_path), st.st_mtime_ns, st.st_size, tuple(allowlist)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _load_current_account_cached(
+    path_str: str, mtime_ns: int, size: int, allowlist: tuple[str, ...]
+) -> Optional[Account]:
+    config_path = Path(path_str)
+    config, text = _read_toml(config_path)
     root = config if isinstance(config, dict) else {}
     default_model = root.get("default_model") if isinstance(root, dict) else None
 
@@ -357,7 +604,7 @@ def load_current_account(
     if email is None:
         email = _extract_email_from_values(root)
     if email is None:
-        email = _extract_email_from_text(config_path.read_text(errors="ignore"))
+        email = _extract_email_from_text(text)
     return Account(
         id="current",
         label=label,
@@ -375,6 +622,6 @@ def copy_account_config(source: str, dest: Path) -> bool:
     dest = dest.expanduser()
     dest.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = dest.with_suffix(dest.suffix + ".tmp")
-    tmp_path.write_text(src.read_text(errors="ignore"), encoding="utf-8")
+    shutil.copyfile(src, tmp_path)
     os.replace(tmp_path, dest)
     return True
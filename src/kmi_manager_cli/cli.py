@@ -16,19 +16,27 @@ error handling and user-friendly output formatting.
 
 from __future__ import annotations
 
+import functools
 import json
+import mmap
 import os
-import socket
+import re
 import subprocess
 import sys
 import time
 import shutil
 import signal
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Optional
 
 import typer
-import httpx
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from kmi_manager_cli import __version__
 from kmi_manager_cli.config import (
@@ -40,6 +48,7 @@ from kmi_manager_cli.config import (
     DEFAULT_KMI_WRITE_CONFIG,
     DEFAULT_KMI_ROTATE_ON_TIE,
     DEFAULT_KMI_PAYMENT_BLOCK_SECONDS,
+    DEFAULT_KMI_HEALTH_CACHE_TTL,
     Config,
     load_config,
 )
@@ -48,36 +57,31 @@ from pathlib import Path
 from kmi_manager_cli.audit import log_audit_event
 from kmi_manager_cli.auth_accounts import (
     Account,
+    accounts_manifest_path,
     copy_account_config,
     load_accounts_from_auths_dir,
     load_current_account,
 )
 from kmi_manager_cli.errors import no_keys_message, remediation_message
-from kmi_manager_cli.health import get_accounts_health, get_health_map
 from kmi_manager_cli.keys import load_auths_dir
 from kmi_manager_cli.logging import get_logger
-from kmi_manager_cli.proxy import parse_listen, run_proxy
 from kmi_manager_cli.proxy_utils import (
     normalize_connect_host,
+    parse_listen,
     proxy_base_url,
     proxy_daemon_log_path,
     proxy_listening,
     proxy_pid_path,
+    state_log_dir,
 )
 from kmi_manager_cli.rotation import is_blocked, is_exhausted, rotate_manual
 from kmi_manager_cli.state import load_state, save_state
 from kmi_manager_cli.time_utils import parse_iso_timestamp
-from kmi_manager_cli.trace import compute_confidence, compute_distribution, trace_path
-from kmi_manager_cli.trace_tui import run_trace_tui
-from rich.console import Group
-from rich.panel import Panel
-from rich.text import Text
-from kmi_manager_cli.ui import (
-    get_console,
-    render_accounts_health_dashboard,
-    render_rotation_dashboard,
-)
-from kmi_manager_cli.doctor import run_doctor
+from kmi_manager_cli.trace import confidence_from_counts, trace_path
+
+# FastAPI (proxy), httpx (health), rich (ui), the trace TUI and the doctor
+# report are imported inside the commands that use them so `kmi --help` and
+# `kmi --status --json` start quickly.
 
 DEFAULT_E2E_REQUESTS = 50
 DEFAULT_E2E_BATCH = 10
@@ -87,6 +91,18 @@ DEFAULT_E2E_MIN_CONFIDENCE = 95.0
 DEFAULT_E2E_TIMEOUT = 10.0
 DEFAULT_E2E_PAUSE = 0.5
 DEFAULT_E2E_SCHEME = "http"
+_E2E_PROGRESS_INTERVAL_SECONDS = 0.1
+
+_TAIL_BLOCK_SIZE = 64 * 1024
+_MMAP_TAIL_THRESHOLD = 1 << 20
+_SINCE_RE = re.compile(r"(\d+)([smhd])", re.ASCII | re.IGNORECASE)
+_SINCE_MULTIPLIERS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+_LOG_TS_FIELD_RE = re.compile(r'\{"ts":\s*"([^"\\]*)"')
+_LOG_TS_VALUE_RE = re.compile(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d ([+-]\d{4})")
+_ANSI_ESCAPE_RE = re.compile(r"\033\[[;?0-9]*[a-zA-Z]")
+
+_PID_CACHE_TTL_SECONDS = 2.0
+_pid_cache: dict[int, tuple[float, Optional[list[int]]]] = {}
 
 
 APP_HELP = (
@@ -106,6 +122,7 @@ APP_HELP = (
     f"  KMI_PAYMENT_BLOCK_SECONDS={DEFAULT_KMI_PAYMENT_BLOCK_SECONDS}\n"
     "  KMI_REQUIRE_USAGE_BEFORE_REQUEST=0\n"
     "  KMI_USAGE_CACHE_SECONDS=600\n"
+    f"  KMI_HEALTH_CACHE_TTL={DEFAULT_KMI_HEALTH_CACHE_TTL}\n"
     "  KMI_BLOCKLIST_RECHECK_SECONDS=3600\n"
     "  KMI_BLOCKLIST_RECHECK_MAX=3\n"
     "  KMI_FAIL_OPEN_ON_EMPTY_CACHE=1\n"
@@ -127,7 +144,7 @@ rotate_app = typer.Typer(help="Rotation commands")
 
 
 def _ensure_single_mode(*flags: bool) -> None:
-    if sum(1 for flag in flags if flag) > 1:
+    if sum(flags) > 1:
         raise typer.BadParameter(
             "Choose only one mode: --rotate, --auto_rotate, --trace, --all, --health, --current, or --status"
         )
@@ -157,27 +174,59 @@ def _load_config_or_exit() -> Config:
         raise typer.Exit(code=2)
 
 
-def _load_registry_or_exit(config):
-    logger = get_logger(config)
-    registry = load_auths_dir(
+def _load_registry(config):
+    return load_auths_dir(
         config.auths_dir,
         config.upstream_base_url,
         config.upstream_allowlist,
-        logger=logger,
+        manifest_path=accounts_manifest_path(config.state_dir),
+        logger=get_logger(config),
     )
+
+
+def _load_registry_or_exit(config):
+    registry = _load_registry(config)
     if not registry.keys:
         typer.echo(no_keys_message(config))
         raise typer.Exit(code=1)
     return registry
 
 
+def _load_context(config, *, require_keys: bool = True):
+    """Load the key registry and the rotation state that goes with it.
+
+    State is read fresh on every call: the proxy may have rewritten it since.
+    """
+    if require_keys:
+        registry = _load_registry_or_exit(config)
+    else:
+        registry = _load_registry(config)
+    return registry, load_state(config, registry)
+
+
+def _active_key(registry, state) -> tuple[int, str]:
+    """Return the clamped active index and its label ("none" when empty)."""
+    keys = registry.keys
+    if not keys:
+        return 0, "none"
+    idx = state.active_index
+    if idx < 0:
+        idx = 0
+    elif idx >= len(keys):
+        idx = len(keys) - 1
+    return idx, keys[idx].label
+
+
 def _manual_rotate(config) -> None:
+    from kmi_manager_cli.health import get_health_map
+    from kmi_manager_cli.ui import render_rotation_dashboard
+
     _note_mode(config)
-    registry = _load_registry_or_exit(config)
-    state = load_state(config, registry)
-    idx = max(0, min(state.active_index, len(registry.keys) - 1))
-    previous_label = registry.keys[idx].label if registry.keys else "none"
-    health = get_health_map(config, registry, state)
+    registry, state = _load_context(config)
+    _, previous_label = _active_key(registry, state)
+    health = get_health_map(
+        config, registry, state, cache_ttl=config.health_cache_ttl_seconds
+    )
     try:
         active, rotated, reason = rotate_manual(
             registry, state, health=health, prefer_next_on_tie=config.rotate_on_tie
@@ -191,6 +240,7 @@ def _manual_rotate(config) -> None:
             config.auths_dir,
             config.upstream_base_url,
             config.upstream_allowlist,
+            manifest_path=accounts_manifest_path(config.state_dir),
         )
         account_map = {account.label: account for account in accounts}
         selected = account_map.get(active.label)
@@ -225,8 +275,7 @@ def _enable_auto_rotate(config) -> None:
             "Auto-rotation is disabled by policy (KMI_AUTO_ROTATE_ALLOWED=false)."
         )
         raise typer.Exit(code=1)
-    registry = _load_registry_or_exit(config)
-    state = load_state(config, registry)
+    registry, state = _load_context(config)
     state.auto_rotate = True
     save_state(config, state)
     log_audit_event(get_logger(config), "auto_rotate_enabled")
@@ -235,13 +284,7 @@ def _enable_auto_rotate(config) -> None:
 
 
 def _disable_auto_rotate(config) -> None:
-    registry = load_auths_dir(
-        config.auths_dir,
-        config.upstream_base_url,
-        config.upstream_allowlist,
-        logger=get_logger(config),
-    )
-    state = load_state(config, registry)
+    registry, state = _load_context(config, require_keys=False)
     if not state.auto_rotate:
         typer.echo("Auto-rotation is already disabled.")
         return
@@ -251,27 +294,25 @@ def _disable_auto_rotate(config) -> None:
     typer.echo("Auto-rotation disabled.")
 
 
+@functools.lru_cache(maxsize=1)
 def _current_config_path() -> Path:
+    # HOME does not change within a CLI run; resolve it once.
     return Path.home() / ".kimi" / "config.toml"
 
 
 def _render_accounts_health(config) -> None:
+    from kmi_manager_cli.health import get_accounts_health
+    from kmi_manager_cli.ui import render_accounts_health_dashboard
+
     _note_mode(config)
-    registry = load_auths_dir(
-        config.auths_dir,
-        config.upstream_base_url,
-        config.upstream_allowlist,
-        logger=get_logger(config),
-    )
-    state = load_state(config, registry)
+    registry, state = _load_context(config, require_keys=False)
     if registry.keys:
-        idx = max(0, min(state.active_index, len(registry.keys) - 1))
-        active_label = registry.keys[idx].label if registry.keys else "none"
-        typer.echo(f"Active key: {active_label}")
+        typer.echo(f"Active key: {_active_key(registry, state)[1]}")
     accounts = load_accounts_from_auths_dir(
         config.auths_dir,
         config.upstream_base_url,
         config.upstream_allowlist,
+        manifest_path=accounts_manifest_path(config.state_dir),
     )
     current = load_current_account(_current_config_path(), config.upstream_allowlist)
     if current:
@@ -279,59 +320,80 @@ def _render_accounts_health(config) -> None:
     if not accounts:
         typer.echo(no_keys_message(config))
         raise typer.Exit(code=1)
-    health = get_accounts_health(config, accounts, state, force_real=False)
+    health = get_accounts_health(
+        config,
+        accounts,
+        state,
+        force_real=False,
+        cache_ttl=config.health_cache_ttl_seconds,
+    )
     render_accounts_health_dashboard(
         accounts, state, health, dry_run=config.dry_run, time_zone=config.time_zone
     )
 
 
 def _render_current_health(config) -> None:
+    from kmi_manager_cli.health import get_accounts_health
+    from kmi_manager_cli.ui import render_accounts_health_dashboard
+
     _note_mode(config)
-    registry = load_auths_dir(
-        config.auths_dir,
-        config.upstream_base_url,
-        config.upstream_allowlist,
-        logger=get_logger(config),
-    )
-    state = load_state(config, registry)
+    registry, state = _load_context(config, require_keys=False)
     if registry.keys:
-        idx = max(0, min(state.active_index, len(registry.keys) - 1))
-        active_label = registry.keys[idx].label if registry.keys else "none"
-        typer.echo(f"Active key: {active_label}")
+        typer.echo(f"Active key: {_active_key(registry, state)[1]}")
     current = load_current_account(_current_config_path(), config.upstream_allowlist)
     if not current:
         typer.echo("No current account found at ~/.kimi/config.toml")
         raise typer.Exit(code=1)
     # Try to map current to a known auth label without extra API calls.
-    accounts = load_accounts_from_auths_dir(
-        config.auths_dir,
-        config.upstream_base_url,
-        config.upstream_allowlist,
+    # The registry already holds every distinct auth key, so the accounts
+    # only need loading when the current key is one of them.
+    account = None
+    if any(key.api_key == current.api_key for key in registry.keys):
+        accounts = load_accounts_from_auths_dir(
+            config.auths_dir,
+            config.upstream_base_url,
+            config.upstream_allowlist,
+            manifest_path=accounts_manifest_path(config.state_dir),
+        )
+        # Reversed so the first auth file wins when credentials are duplicated.
+        by_credentials = {
+            (account.base_url, account.api_key): account
+            for account in reversed(accounts)
+        }
+        account = by_credentials.get((current.base_url, current.api_key))
+    if account is not None:
+        current = Account(
+            id=current.id,
+            label=f"current:{account.label}",
+            api_key=current.api_key,
+            base_url=current.base_url,
+            source=current.source,
+            email=current.email,
+        )
+    health = get_accounts_health(
+        config,
+        [current],
+        state,
+        force_real=False,
+        cache_ttl=config.health_cache_ttl_seconds,
     )
-    for account in accounts:
-        if account.base_url == current.base_url and account.api_key == current.api_key:
-            current = Account(
-                id=current.id,
-                label=f"current:{account.label}",
-                api_key=current.api_key,
-                base_url=current.base_url,
-                source=current.source,
-                email=current.email,
-            )
-            break
-    health = get_accounts_health(config, [current], state, force_real=False)
     render_accounts_health_dashboard(
         [current], state, health, dry_run=config.dry_run, time_zone=config.time_zone
     )
 
 
 def _build_status_payload(config, registry, state) -> dict:
-    idx = max(0, min(state.active_index, len(registry.keys) - 1))
-    active_label = registry.keys[idx].label if registry.keys else "none"
-    total_keys = len(registry.keys)
-    disabled = sum(1 for key in registry.keys if key.disabled)
-    blocked = sum(1 for key in registry.keys if is_blocked(state, key.label))
-    exhausted = sum(1 for key in registry.keys if is_exhausted(state, key.label))
+    _, active_label = _active_key(registry, state)
+    keys = registry.keys
+    total_keys = len(keys)
+    disabled = blocked = exhausted = 0
+    for key in keys:
+        if key.disabled:
+            disabled += 1
+        if is_blocked(state, key.label):
+            blocked += 1
+        if is_exhausted(state, key.label):
+            exhausted += 1
 
     host, port = parse_listen(config.proxy_listen)
     connect_host = normalize_connect_host(host)
@@ -383,16 +445,68 @@ def _status_badge(ok: bool, warn: bool = False) -> tuple[str, str]:
     return "🔴", "red"
 
 
+def _echo_json(payload: dict) -> None:
+    """Print payload as indented JSON, via orjson when it is installed.
+
+    orjson never escapes non-ASCII, so its output is only used when it is
+    pure ASCII; otherwise the stdlib encoding keeps the output identical.
+    """
+    if orjson is not None:
+        buffer = getattr(sys.stdout, "buffer", None)
+        try:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            data = b""
+        if buffer is not None and data and data.isascii():
+            sys.stdout.flush()
+            buffer.write(data + b"\n")
+            buffer.flush()
+            return
+    typer.echo(json.dumps(payload, indent=2, ensure_ascii=True))
+
+
+@functools.lru_cache(maxsize=1)
+def _status_labels() -> dict:
+    """Static label segments for the status panels, styled once and reused."""
+    from rich.text import Text
+
+    cyan = {
+        "proxy_url": "🔗 Proxy URL: ",
+        "upstream": "🌐 Upstream: ",
+        "active_key": "🔑 Active key: ",
+        "rotation": "🔁 Rotation: ",
+        "policy": "🛡️ Policy: ",
+        "cache": "🧠 Cache: ",
+        "payment_block": "💳 Payment block: ",
+        "daemon_log": "🧾 Daemon log: ",
+    }
+    bold = {
+        "status": "Status: ",
+        "keys": "Keys: ",
+        "health_refresh": "Health refresh: ",
+    }
+    labels = {name: Text(text, style="cyan") for name, text in cyan.items()}
+    labels.update({name: Text(text, style="bold") for name, text in bold.items()})
+    labels["title"] = Text("=== KMI Status ===", style="bold")
+    return labels
+
+
 def _render_status(config, *, as_json: bool = False) -> None:
     if not as_json:
         _note_mode(config)
-    registry = _load_registry_or_exit(config)
-    state = load_state(config, registry)
+    registry, state = _load_context(config)
     payload = _build_status_payload(config, registry, state)
     if as_json:
-        typer.echo(json.dumps(payload, indent=2, ensure_ascii=True))
+        _echo_json(payload)
         return
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+
+    from kmi_manager_cli.ui import get_console
+
     console = get_console()
+    labels = _status_labels()
 
     proxy = payload["proxy"]
     pids = proxy["pids"]
@@ -405,19 +519,18 @@ def _render_status(config, *, as_json: bool = False) -> None:
     else:
         pid_text = ", ".join(str(pid) for pid in pids)
 
-    title = Text("=== KMI Status ===", style="bold")
-    console.print(title)
+    console.print(labels["title"])
 
     proxy_emoji, proxy_color = _status_badge(proxy["running"])
     proxy_lines = [
         Text.assemble(
             (f"{proxy_emoji} ", proxy_color),
-            ("Status: ", "bold"),
+            labels["status"],
             ("running" if proxy["running"] else "stopped", proxy_color),
             (f" on {proxy['host']}:{proxy['port']} (pid: {pid_text})", ""),
         ),
-        Text.assemble(("🔗 Proxy URL: ", "cyan"), (proxy["url"], "")),
-        Text.assemble(("🌐 Upstream: ", "cyan"), (payload["upstream"], "")),
+        Text.assemble(labels["proxy_url"], (proxy["url"], "")),
+        Text.assemble(labels["upstream"], (payload["upstream"], "")),
     ]
     console.print(Panel(Group(*proxy_lines), title="Proxy", border_style=proxy_color))
     console.print()
@@ -429,7 +542,7 @@ def _render_status(config, *, as_json: bool = False) -> None:
     keys_lines = [
         Text.assemble(
             (f"{keys_emoji} ", keys_color),
-            ("Keys: ", "bold"),
+            labels["keys"],
             (
                 "total={total} disabled={disabled} blocked={blocked} exhausted={exhausted}".format(
                     **keys
@@ -437,7 +550,7 @@ def _render_status(config, *, as_json: bool = False) -> None:
                 "",
             ),
         ),
-        Text.assemble(("🔑 Active key: ", "cyan"), (payload["active_key"], "")),
+        Text.assemble(labels["active_key"], (payload["active_key"], "")),
     ]
     console.print(Panel(Group(*keys_lines), title="Keys", border_style=keys_color))
     console.print()
@@ -446,7 +559,7 @@ def _render_status(config, *, as_json: bool = False) -> None:
     policy = payload["policy"]
     rotation_lines = [
         Text.assemble(
-            ("🔁 Rotation: ", "cyan"),
+            labels["rotation"],
             (
                 f"active_index={rotation['active_index']} rotation_index={rotation['rotation_index']} "
                 f"auto_rotate={rotation['auto_rotate']}",
@@ -454,7 +567,7 @@ def _render_status(config, *, as_json: bool = False) -> None:
             ),
         ),
         Text.assemble(
-            ("🛡️ Policy: ", "cyan"),
+            labels["policy"],
             (
                 "strict_usage_check="
                 f"{'on' if policy['strict_usage_check'] else 'off'} "
@@ -474,7 +587,7 @@ def _render_status(config, *, as_json: bool = False) -> None:
     refresh_emoji, refresh_color = _status_badge(refresh_ok, warn=not refresh_ok)
     cache_lines = [
         Text.assemble(
-            ("🧠 Cache: ", "cyan"),
+            labels["cache"],
             (
                 "usage_refresh="
                 f"{cache['usage_refresh_seconds']}s "
@@ -484,11 +597,11 @@ def _render_status(config, *, as_json: bool = False) -> None:
             ),
         ),
         Text.assemble(
-            ("💳 Payment block: ", "cyan"), (f"{payload['payment_block_seconds']}s", "")
+            labels["payment_block"], (f"{payload['payment_block_seconds']}s", "")
         ),
         Text.assemble(
             (f"{refresh_emoji} ", refresh_color),
-            ("Health refresh: ", "bold"),
+            labels["health_refresh"],
             (last_refresh or "never", ""),
         ),
     ]
@@ -497,7 +610,7 @@ def _render_status(config, *, as_json: bool = False) -> None:
     )
     console.print()
 
-    log_line = Text.assemble(("🧾 Daemon log: ", "cyan"), (proxy["daemon_log"], ""))
+    log_line = Text.assemble(labels["daemon_log"], (proxy["daemon_log"], ""))
     console.print(Panel(Group(log_line), title="Logs", border_style="blue"))
 
     alerts: list[Text] = []
@@ -582,6 +695,8 @@ def main_callback(
             )
         raise typer.Exit()
     if trace:
+        from kmi_manager_cli.trace_tui import run_trace_tui
+
         run_trace_tui(config)
         raise typer.Exit()
     if health_flag or all_:
@@ -614,7 +729,7 @@ def proxy(
     """Start the local proxy server."""
     config = _load_config_or_exit()
     _note_mode(config)
-    _ensure_proxy_port_free(config)
+    registry = _free_port_and_load_registry(config)
     scheme = "https" if config.proxy_tls_terminated else "http"
     typer.echo(
         f"🚀 Starting proxy at {scheme}://{config.proxy_listen}{config.proxy_base_path}"
@@ -624,19 +739,49 @@ def proxy(
             "Note: TLS termination required for remote access (set KMI_PROXY_TLS_TERMINATED=1)."
         )
     if daemon:
-        _load_registry_or_exit(config)
         _start_proxy_daemon(config)
-        if sys.stdin.isatty() and typer.confirm('Run "kmi trace" now?', default=False):
-            run_trace_tui(config)
+        _offer_trace(config)
         raise typer.Exit()
-    registry = _load_registry_or_exit(config)
+    from kmi_manager_cli.proxy import run_proxy
+
     state = load_state(config, registry)
     try:
         run_proxy(config, registry, state)
     except ValueError as exc:
         typer.echo(str(exc))
         raise typer.Exit(code=1)
+    _offer_trace(config)
+
+
+def _free_port_and_load_registry(config: Config):
+    """Check/free the proxy port in a worker while the registry loads.
+
+    Both are I/O bound and independent. The port check's messages are
+    collected and echoed from this thread once it finishes, so the output
+    (and a port failure taking precedence) is the same as when the two ran
+    one after the other.
+    """
+    lines: list[str] = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        port_free = executor.submit(_ensure_proxy_port_free, config, lines.append)
+        try:
+            registry = _load_registry(config)
+        finally:
+            try:
+                port_free.result()
+            finally:
+                for line in lines:
+                    typer.echo(line)
+    if not registry.keys:
+        typer.echo(no_keys_message(config))
+        raise typer.Exit(code=1)
+    return registry
+
+
+def _offer_trace(config: Config) -> None:
     if sys.stdin.isatty() and typer.confirm('Run "kmi trace" now?', default=False):
+        from kmi_manager_cli.trace_tui import run_trace_tui
+
         run_trace_tui(config)
 
 
@@ -704,23 +849,55 @@ def proxy_restart(
 
 
 def _app_log_path(config: Config) -> Path:
-    log_dir = config.state_dir.expanduser() / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
-    return log_dir / "kmi.log"
+    return state_log_dir(config) / "kmi.log"
+
+
+def _read_tail_blocks(handle, size: int, limit: int) -> bytes:
+    # Read backwards in blocks until limit + 1 newlines are seen, so only the
+    # tail of the log is read instead of the whole file.
+    blocks: list[bytes] = []
+    newlines = 0
+    pos = size
+    while pos > 0 and newlines <= limit:
+        step = min(_TAIL_BLOCK_SIZE, pos)
+        pos -= step
+        handle.seek(pos)
+        block = handle.read(step)
+        newlines += block.count(b"\n")
+        blocks.append(block)
+    return b"".join(reversed(blocks))
+
+
+def _read_tail_mmap(handle, limit: int) -> bytes:
+    with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        end = len(mapped)
+        if mapped[end - 1 : end] == b"\n":
+            end -= 1
+        start = end
+        for _ in range(limit):
+            start = mapped.rfind(b"\n", 0, start)
+            if start < 0:
+                break
+        return mapped[start + 1 :]
 
 
 def _read_tail_lines(path: Path, limit: int) -> list[str]:
     if limit <= 0 or not path.exists():
         return []
-    buffer: list[str] = []
-    from collections import deque
-
-    tail = deque(maxlen=limit)
     with path.open("rb") as handle:
-        for line in handle:
-            tail.append(line.decode("utf-8", errors="ignore").rstrip("\n"))
-    buffer.extend(tail)
-    return buffer
+        size = handle.seek(0, os.SEEK_END)
+        data = None
+        if size > _MMAP_TAIL_THRESHOLD:
+            try:
+                data = _read_tail_mmap(handle, limit)
+            except (OSError, ValueError):
+                data = None
+        if data is None:
+            data = _read_tail_blocks(handle, size, limit)
+    raw_lines = data.split(b"\n")
+    if raw_lines[-1] == b"":
+        raw_lines.pop()
+    return [line.decode("utf-8", errors="ignore") for line in raw_lines[-limit:]]
 
 
 def _parse_log_timestamp(value: str) -> Optional[datetime]:
@@ -741,16 +918,9 @@ def _parse_since(value: str) -> Optional[datetime]:
     raw = value.strip()
     if not raw:
         return None
-    if raw[-1].lower() in {"s", "m", "h", "d"} and raw[:-1].isdigit():
-        amount = int(raw[:-1])
-        unit = raw[-1].lower()
-        seconds = amount
-        if unit == "m":
-            seconds *= 60
-        elif unit == "h":
-            seconds *= 3600
-        elif unit == "d":
-            seconds *= 86400
+    match = _SINCE_RE.fullmatch(raw)
+    if match:
+        seconds = int(match.group(1)) * _SINCE_MULTIPLIERS[match.group(2).lower()]
         return datetime.now(timezone.utc) - timedelta(seconds=seconds)
     parsed = _parse_log_timestamp(raw)
     return parsed
@@ -761,20 +931,41 @@ def _filter_lines_since(
 ) -> list[str]:
     if since is None:
         return lines
+    # App logs are written as {"ts":"YYYY-MM-DD HH:MM:SS +HHMM", ...}; for that
+    # shape the timestamp is compared as a string against the cutoff rendered
+    # in the same offset, skipping json.loads and datetime parsing per line.
+    cutoffs: dict[str, str] = {}
+    ceiling = since
+    if since.microsecond:
+        ceiling = since + timedelta(microseconds=1_000_000 - since.microsecond)
     filtered: list[str] = []
     for line in lines:
         ts_value = None
         if json_lines:
-            try:
-                payload = json.loads(line)
-                ts_value = payload.get("ts")
-            except Exception:
-                ts_value = None
-        else:
-            ts_value = None
+            match = _LOG_TS_FIELD_RE.match(line)
+            if match:
+                ts_value = match.group(1)
+            else:
+                try:
+                    payload = json.loads(line)
+                    ts_value = payload.get("ts")
+                except Exception:
+                    ts_value = None
         if ts_value is None:
             continue
-        parsed = _parse_log_timestamp(str(ts_value))
+        ts_text = str(ts_value)
+        fast = _LOG_TS_VALUE_RE.fullmatch(ts_text) if since.tzinfo else None
+        if fast:
+            offset = fast.group(1)
+            cutoff = cutoffs.get(offset)
+            if cutoff is None:
+                tzinfo = datetime.strptime(offset, "%z").tzinfo
+                cutoff = ceiling.astimezone(tzinfo).strftime("%Y-%m-%d %H:%M:%S")
+                cutoffs[offset] = cutoff
+            if ts_text[:19] >= cutoff:
+                filtered.append(line)
+            continue
+        parsed = _parse_log_timestamp(ts_text)
         if parsed is None:
             continue
         if parsed.tzinfo is None:
@@ -784,6 +975,27 @@ def _filter_lines_since(
     return filtered
 
 
+def _line_output() -> tuple[Callable[[str], None], Callable[[], None]]:
+    """Return ``(write, flush)`` callables for streaming log lines.
+
+    typer.echo flushes on every call, which dominates when output is piped.
+    For a non-TTY stdout, lines go straight to the byte buffer (ANSI codes
+    stripped, as echo would) and are flushed once per batch instead.
+    """
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    if buffer is None or stdout.isatty():
+        return typer.echo, lambda: None
+    stdout.flush()
+
+    def write(line: str) -> None:
+        if "\x1b" in line:
+            line = _ANSI_ESCAPE_RE.sub("", line)
+        buffer.write(line.encode("utf-8", errors="replace") + b"\n")
+
+    return write, buffer.flush
+
+
 def _tail_file(
     path: Path,
     lines: int,
@@ -795,8 +1007,10 @@ def _tail_file(
     if not path.exists():
         typer.echo(f"Log file not found: {path}")
         raise typer.Exit(code=1)
+    write, flush = _line_output()
     for line in _filter_lines_since(_read_tail_lines(path, lines), since, json_lines):
-        typer.echo(line)
+        write(line)
+    flush()
     if not follow:
         return
     with path.open("rb") as handle:
@@ -806,12 +1020,13 @@ def _tail_file(
             if data:
                 line = data.decode("utf-8", errors="ignore").rstrip("\n")
                 if since is None:
-                    typer.echo(line)
+                    write(line)
                 else:
                     filtered = _filter_lines_since([line], since, json_lines)
                     if filtered:
-                        typer.echo(filtered[0])
+                        write(filtered[0])
                 continue
+            flush()
             time.sleep(max(sleep_seconds, 0.1))
 
 
@@ -841,61 +1056,184 @@ def _start_proxy_daemon(config: Config) -> None:
     typer.echo("Stop: kmi proxy-stop")
 
 
-def _ensure_proxy_port_free(config: Config) -> None:
+def _ensure_proxy_port_free(
+    config: Config, echo: Callable[[str], None] = typer.echo
+) -> None:
     host, port = parse_listen(config.proxy_listen)
     connect_host = normalize_connect_host(host)
-    typer.echo(f"🩺 Doctor: checking {connect_host}:{port}")
-    if not proxy_listening(connect_host, port):
-        typer.echo("✅ No existing listener detected.")
+    echo(f"🩺 Doctor: checking {connect_host}:{port}")
+    if not proxy_listening(connect_host, port, force=True):
+        echo("✅ No existing listener detected.")
         return
-    typer.echo(f"⚠️ Existing listener detected on {connect_host}:{port}")
+    echo(f"⚠️ Existing listener detected on {connect_host}:{port}")
     pids = _find_listening_pids(port)
     if pids is None:
-        typer.echo(
-            "❌ 'lsof' not available; cannot auto-stop. Use Ctrl+C or kmi proxy-stop."
-        )
+        echo("❌ 'lsof' not available; cannot auto-stop. Use Ctrl+C or kmi proxy-stop.")
         raise typer.Exit(code=1)
-    typer.echo(f"🛑 Stopping PID(s): {', '.join(str(pid) for pid in pids)}")
-    _terminate_pids(pids, force=False)
-    time.sleep(0.5)
-    if proxy_listening(connect_host, port):
-        typer.echo("⚠️ Still listening, forcing kill.")
-        _terminate_pids(pids, force=True)
-        time.sleep(0.5)
-    if proxy_listening(connect_host, port):
-        typer.echo("❌ Port still in use. Stop manually and retry.")
-        raise typer.Exit(code=1)
-    typer.echo("✅ Old listener stopped.")
+    echo(f"🛑 Stopping PID(s): {', '.join(str(pid) for pid in pids)}")
+    daemon_pid = _read_daemon_pid(config)
+    _terminate_pids(pids, force=False, daemon_pid=daemon_pid)
+    if not _wait_for_port_release(connect_host, port):
+        echo("⚠️ Still listening, forcing kill.")
+        _terminate_pids(pids, force=True, daemon_pid=daemon_pid)
+        if not _wait_for_port_release(connect_host, port):
+            echo("❌ Port still in use. Stop manually and retry.")
+            raise typer.Exit(code=1)
+    echo("✅ Old listener stopped.")
+
+
+def _wait_for_port_release(host: str, port: int, timeout: float = 0.5) -> bool:
+    """Poll with exponential backoff (20ms, 40ms, ...) until the port is free."""
+    deadline = time.monotonic() + timeout
+    delay = 0.02
+    while proxy_listening(host, port, force=True):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay *= 2
+    return True
+
+
+def _wait_for_port_listen(host: str, port: int, timeout: float = 10.0) -> bool:
+    """Poll with exponential backoff (10ms, 20ms, ... capped at 200ms) until
+    something accepts connections on the port."""
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while not proxy_listening(host, port, force=True):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.2)
+    return True
 
 
 def _find_listening_pids(port: int) -> list[int] | None:
+    cached = _pid_cache.get(port)
+    if cached is not None and time.monotonic() - cached[0] < _PID_CACHE_TTL_SECONDS:
+        return None if cached[1] is None else list(cached[1])
+    pids = _proc_listening_pids(port) if sys.platform.startswith("linux") else None
+    if pids is None:
+        pids = _lsof_listening_pids(port)
+    _pid_cache[port] = (time.monotonic(), pids)
+    return None if pids is None else list(pids)
+
+
+def _proc_listening_pids(port: int) -> list[int] | None:
+    """Resolve listener PIDs from /proc without forking lsof (Linux only).
+
+    Returns None when /proc cannot be read so the caller can fall back.
+    """
+    suffix = f":{port:04X}"
+    inodes: set[str] = set()
+    readable = False
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table, encoding="ascii") as handle:
+                next(handle, None)
+                readable = True
+                for row in handle:
+                    fields = row.split()
+                    if (
+                        len(fields) > 9
+                        and fields[3] == "0A"
+                        and fields[1].endswith(suffix)
+                    ):
+                        inodes.add(fields[9])
+        except OSError:
+            continue
+    if not readable:
+        return None
+    if not inodes:
+        return []
+    targets = {f"socket:[{inode}]" for inode in inodes}
+    pids: list[int] = []
+    with os.scandir("/proc") as procs:
+        for proc in procs:
+            if not proc.name.isdigit():
+                continue
+            try:
+                with os.scandir(f"/proc/{proc.name}/fd") as fds:
+                    for fd in fds:
+                        try:
+                            if os.readlink(fd.path) in targets:
+                                pids.append(int(proc.name))
+                                break
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+    return sorted(pids)
+
+
+def _lsof_listening_pids(port: int) -> list[int] | None:
     lsof = shutil.which("lsof")
     if not lsof:
         return None
+    # Raw bytes skip the text decoding layer; close_fds=False is safe since
+    # our fds are non-inheritable (PEP 446) and lets CPython use posix_spawn.
     result = subprocess.run(
         [lsof, "-nP", f"-iTCP:{port}", "-sTCP:LISTEN", "-t"],
         capture_output=True,
-        text=True,
         check=False,
+        close_fds=False,
     )
-    pids: list[int] = []
+    pids: set[int] = set()
     for line in result.stdout.splitlines():
-        line = line.strip()
-        if not line:
-            continue
         try:
-            pids.append(int(line))
+            pids.add(int(line))
         except ValueError:
             continue
-    return sorted(set(pids))
+    return sorted(pids)
+
 
+def _terminate_pids(
+    pids: list[int], force: bool, daemon_pid: Optional[int] = None
+) -> None:
+    """Signal ``pids``; the whole group only when it is our own proxy daemon.
 
-def _terminate_pids(pids: list[int], force: bool) -> None:
+    ``daemon_pid`` is the PID recorded by _start_proxy_daemon. Any other
+    listener may lead a shell job (e.g. ``kmi proxy --foreground | tee``),
+    so it gets a per-pid signal and the rest of its group is left alone.
+    """
+    _pid_cache.clear()
     sig = signal.SIGKILL if force else signal.SIGTERM
+    pgid = _shared_process_group(pids)
+    if pgid is not None and pgid == daemon_pid:
+        os.killpg(pgid, sig)
+        return
     for pid in pids:
         os.kill(pid, sig)
 
 
+def _read_daemon_pid(config: Config) -> Optional[int]:
+    try:
+        return int(proxy_pid_path(config).read_text(encoding="utf-8").strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _shared_process_group(pids: list[int]) -> Optional[int]:
+    """Return the group led by one of ``pids`` when they all share it.
+
+    Never our own group. Whether that group may be signalled is up to the
+    caller (see _terminate_pids).
+    """
+    if not pids or not hasattr(os, "killpg"):
+        return None
+    try:
+        groups = {os.getpgid(pid) for pid in pids}
+    except OSError:
+        return None
+    if len(groups) != 1:
+        return None
+    pgid = groups.pop()
+    if pgid not in pids or pgid == os.getpgrp():
+        return None
+    return pgid
+
+
 def _stop_proxy(config: Config, *, yes: bool, force: bool) -> bool:
     host, port = parse_listen(config.proxy_listen)
     pid_path = proxy_pid_path(config)
@@ -934,35 +1272,139 @@ def _stop_proxy(config: Config, *, yes: bool, force: bool) -> bool:
     return True
 
 
-def _read_new_trace_entries(path: Path, offset: int) -> tuple[list[dict], int]:
-    if not path.exists():
-        return [], offset
-    size = path.stat().st_size
-    if size < offset:
-        offset = 0
-    with path.open("rb") as handle:
-        handle.seek(offset)
-        data = handle.read()
-    if not data:
-        return [], offset
-    last_newline = data.rfind(b"\n")
-    if last_newline == -1:
-        return [], offset
-    data = data[: last_newline + 1]
-    new_offset = offset + last_newline + 1
+class _TraceTail:
+    """Follows a trace file, returning entries from newly completed lines.
+
+    The file descriptor stays open between reads and a trailing partial line
+    is kept in a buffer. Each read is one stat of the path plus, when the
+    file grew, one pread of just the appended bytes. The file is reopened
+    from the start when it is rotated or truncated.
+
+    With ``needle`` set, lines that do not contain those bytes are dropped
+    before JSON decoding.
+    """
+
+    def __init__(
+        self, path: Path, offset: int = 0, needle: Optional[bytes] = None
+    ) -> None:
+        self.path = path
+        self.offset = offset
+        self.needle = needle
+        self._fd: Optional[int] = None
+        self._identity: Optional[tuple[int, int]] = None
+        self._buffer = bytearray()
+
+    def read(self) -> list[dict]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return []
+        size = stat.st_size
+        if self._fd is not None and (
+            (stat.st_dev, stat.st_ino) != self._identity
+            or size < self.offset + len(self._buffer)
+        ):
+            self.close()
+            self.offset = 0
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            opened = os.fstat(self._fd)
+            self._identity = (opened.st_dev, opened.st_ino)
+            size = opened.st_size
+            if size < self.offset:
+                self.offset = 0
+            self._buffer.clear()
+        position = self.offset + len(self._buffer)
+        if size <= position:
+            return []
+        self._buffer += _pread(self._fd, size - position, position)
+        end = self._buffer.rfind(b"\n") + 1
+        if not end:
+            return []
+        data = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        self.offset += end
+        return _parse_trace_lines(data, self.needle)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def _pread(fd: int, size: int, offset: int) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, offset)
+    os.lseek(fd, offset, os.SEEK_SET)  # pragma: no cover - Windows
+    return os.read(fd, size)  # pragma: no cover - Windows
+
+
+def _parse_trace_lines(data: bytes, needle: Optional[bytes] = None) -> list[dict]:
+    # Both parsers take bytes directly; invalid UTF-8 surfaces as ValueError.
+    loads = orjson.loads if orjson is not None else json.loads
     entries: list[dict] = []
-    for line in data.splitlines():
+    for line in data.split(b"\n"):
+        if not line or (needle is not None and needle not in line):
+            continue
         try:
-            entries.append(json.loads(line.decode("utf-8", errors="ignore")))
-        except json.JSONDecodeError:
+            entries.append(loads(line))
+        except ValueError:
             continue
-    return entries, new_offset
+    return entries
+
+
+def _read_new_trace_entries(path: Path, offset: int) -> tuple[list[dict], int]:
+    tail = _TraceTail(path, offset)
+    try:
+        entries = tail.read()
+    finally:
+        tail.close()
+    return entries, tail.offset
 
 
 def _format_counts(counts: dict[str, int]) -> str:
     if not counts:
         return "-"
-    return ", ".join(f"{label}:{count}" for label, count in sorted(counts.items()))
+    return ", ".join(map("%s:%d".__mod__, sorted(counts.items())))
+
+
+async def _send_one(client, request) -> bool:
+    import httpx
+
+    try:
+        resp = await client.send(request)
+    except httpx.HTTPError:
+        return False
+    return resp.status_code < 400
+
+
+async def _send_batch(client, request, count: int) -> int:
+    """Send ``request`` ``count`` times concurrently and return how many failed."""
+    import asyncio
+
+    results = await asyncio.gather(*(_send_one(client, request) for _ in range(count)))
+    return sum(1 for ok in results if not ok)
+
+
+def _start_proxy_thread(config: Config, registry) -> Callable[[], None]:
+    """Serve the proxy from a daemon thread of this process.
+
+    Saves spawning and importing a second interpreter for a short e2e run.
+    Returns a function that shuts the server down and waits for it.
+    """
+    import threading
+
+    from kmi_manager_cli.proxy import create_proxy_server
+
+    server = create_proxy_server(config, registry, load_state(config, registry))
+    thread = threading.Thread(target=server.run, name="kmi-proxy", daemon=True)
+    thread.start()
+
+    def stop() -> None:
+        server.should_exit = True
+        thread.join(timeout=5)
+
+    return stop
 
 
 def _run_e2e(
@@ -978,7 +1420,12 @@ def _run_e2e(
     scheme: str,
     show_mode: bool = True,
     enable_auto_rotate: bool = True,
+    spawn_proxy: bool = False,
 ) -> float:
+    import asyncio
+
+    import httpx
+
     if requests <= 0 or batch <= 0 or window <= 0:
         raise typer.BadParameter("--requests, --batch, and --window must be positive")
     scheme = scheme.lower()
@@ -997,24 +1444,35 @@ def _run_e2e(
     registry = _load_registry_or_exit(config)
     host, port = parse_listen(config.proxy_listen)
     connect_host = normalize_connect_host(host)
+    stop_proxy = None
     started_proc = None
     if not proxy_listening(connect_host, port):
         typer.echo("Proxy is not running; starting it now...")
-        try:
-            started_proc = subprocess.Popen(
-                ["kmi", "proxy"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-            )
-        except FileNotFoundError:
-            typer.echo(
-                "Unable to start proxy via 'kmi proxy'. Ensure 'kmi' is in PATH."
-            )
-            raise typer.Exit(code=1)
-        for _ in range(20):
-            time.sleep(0.5)
-            if proxy_listening(connect_host, port):
-                break
+        if spawn_proxy:
+            # 'kmi proxy' daemonizes and writes the PID file, so the proxy
+            # outlives this run and proxy-stop can find it.
+            try:
+                started_proc = subprocess.Popen(
+                    ["kmi", "proxy"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            except FileNotFoundError:
+                typer.echo(
+                    "Unable to start proxy via 'kmi proxy'. Ensure 'kmi' is in PATH."
+                )
+                raise typer.Exit(code=1)
+        else:
+            try:
+                stop_proxy = _start_proxy_thread(config, registry)
+            except ValueError as exc:
+                typer.echo(str(exc))
+                raise typer.Exit(code=1)
+        _wait_for_port_listen(connect_host, port)
     if not proxy_listening(connect_host, port):
         typer.echo("Proxy did not start or is not reachable.")
+        if stop_proxy:
+            stop_proxy()
         if started_proc:
             started_proc.terminate()
         raise typer.Exit(code=1)
@@ -1030,42 +1488,76 @@ def _run_e2e(
     trace_file = trace_path(config)
     trace_file.parent.mkdir(parents=True, exist_ok=True)
     offset = trace_file.stat().st_size if trace_file.exists() else 0
+    # The trace writer uses json.dumps(ensure_ascii=True), so an entry for
+    # `path` contains its JSON-encoded form whatever the key order or spacing.
+    # Lines without it are skipped before decoding.
+    trace_tail = _TraceTail(trace_file, offset, needle=json.dumps(path).encode())
 
     total_sent = 0
     errors = 0
     confidence = 0.0
-    collected: list[dict] = []
-    try:
-        with httpx.Client(timeout=timeout) as client:
+    collected = 0
+    # Labels of the last `window` matching entries and their running counts,
+    # updated per entry instead of recounting the window after every batch.
+    sample: deque[str] = deque(maxlen=window)
+    counts: Counter[str] = Counter()
+
+    async def send_batches() -> None:
+        # Each batch goes out concurrently, so a batch costs about one round
+        # trip through the proxy instead of one per request.
+        nonlocal total_sent, errors, confidence, collected
+        limits = httpx.Limits(max_connections=batch, max_keepalive_connections=batch)
+        transport = httpx.AsyncHTTPTransport(retries=0, limits=limits)
+        async with httpx.AsyncClient(timeout=timeout, transport=transport) as client:
+            # The GET never changes, so URL parsing and header merging happen once.
+            request = client.build_request("GET", url, headers=headers)
+            last_echo = float("-inf")
             while total_sent < requests:
                 current_batch = min(batch, requests - total_sent)
-                for _ in range(current_batch):
-                    try:
-                        resp = client.request("GET", url, headers=headers)
-                        if resp.status_code >= 400:
-                            errors += 1
-                    except httpx.HTTPError:
-                        errors += 1
-                    total_sent += 1
+                errors += await _send_batch(client, request, current_batch)
+                total_sent += current_batch
                 if pause > 0:
-                    time.sleep(pause)
-                new_entries, offset = _read_new_trace_entries(trace_file, offset)
-                for entry in new_entries:
-                    if entry.get("endpoint") == path:
-                        collected.append(entry)
-                sample = collected[-window:] if collected else []
-                confidence = compute_confidence(sample) if sample else 0.0
-                counts, _ = compute_distribution(sample)
-                keys_seen = len(counts)
-                typer.echo(
-                    f"sent={total_sent}/{requests} trace={len(collected)} keys={keys_seen}/{len(registry.keys)} "
-                    f"confidence={confidence}% errors={errors}"
+                    await asyncio.sleep(pause)
+                for entry in trace_tail.read():
+                    if entry.get("endpoint") != path:
+                        continue
+                    if len(sample) == window:
+                        evicted = sample[0]
+                        counts[evicted] -= 1
+                        if not counts[evicted]:
+                            del counts[evicted]
+                    label = entry.get("key_label", "unknown")
+                    sample.append(label)
+                    counts[label] += 1
+                    collected += 1
+                confidence = (
+                    confidence_from_counts(counts, len(sample)) if sample else 0.0
                 )
-                if confidence >= min_confidence and len(sample) >= min(
+                reached = confidence >= min_confidence and len(sample) >= min(
                     window, requests
+                )
+                # With little or no pause, batches finish faster than anyone
+                # can read; throttle progress but always show the last line.
+                now = time.monotonic()
+                if (
+                    reached
+                    or total_sent >= requests
+                    or now - last_echo >= _E2E_PROGRESS_INTERVAL_SECONDS
                 ):
+                    last_echo = now
+                    typer.echo(
+                        f"sent={total_sent}/{requests} trace={collected} keys={len(counts)}/{len(registry.keys)} "
+                        f"confidence={confidence}% errors={errors}"
+                    )
+                if reached:
                     break
+
+    try:
+        asyncio.run(send_batches())
     finally:
+        trace_tail.close()
+        if stop_proxy:
+            stop_proxy()
         if started_proc:
             started_proc.terminate()
             try:
@@ -1073,9 +1565,7 @@ def _run_e2e(
             except subprocess.TimeoutExpired:
                 started_proc.kill()
 
-    sample = collected[-window:] if collected else []
-    counts, total = compute_distribution(sample)
-    typer.echo(f"Distribution (last {total}): {_format_counts(counts)}")
+    typer.echo(f"Distribution (last {len(sample)}): {_format_counts(counts)}")
     if confidence >= min_confidence:
         typer.echo(f"E2E OK: confidence={confidence}%")
     else:
@@ -1109,6 +1599,12 @@ def e2e(
     scheme: str = typer.Option(
         DEFAULT_E2E_SCHEME, "--scheme", help="Proxy scheme (http or https)."
     ),
+    spawn_proxy: bool = typer.Option(
+        False,
+        "--spawn-proxy",
+        help="If no proxy is running, start the 'kmi proxy' daemon and leave it "
+        "running instead of serving one in-process for this run.",
+    ),
 ) -> None:
     """Run a round-robin proxy E2E check."""
     config = _load_config_or_exit()
@@ -1123,12 +1619,15 @@ def e2e(
         pause=pause,
         scheme=scheme,
         enable_auto_rotate=True,
+        spawn_proxy=spawn_proxy,
     )
 
 
 @app.command()
 def trace() -> None:
     """Show live trace view."""
+    from kmi_manager_cli.trace_tui import run_trace_tui
+
     config = _load_config_or_exit()
     _note_mode(config)
     run_trace_tui(config)
@@ -1159,6 +1658,8 @@ def doctor(
         raise typer.BadParameter(
             "Choose only one: --recheck-keys or --clear-blocklist."
         )
+    from kmi_manager_cli.doctor import run_doctor
+
     config = _load_config_or_exit()
     exit_code = run_doctor(
         config, recheck_keys=recheck_keys, clear_blocklist=clear_blocklist
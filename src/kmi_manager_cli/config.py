@@ -12,7 +12,7 @@ Key Components:
 Configuration Sources (in order of precedence):
     1. Explicit env_path argument to load_config()
     2. KMI_ENV_PATH environment variable
-    3. .env file in project root
+    3. .env file in the working directory, then in the project root
     4. Existing environment variables
     5. Default constants (DEFAULT_*)
 
@@ -24,6 +24,7 @@ Security Features:
 
 from __future__ import annotations
 
+import functools
 import os
 from urllib.parse import urlparse
 from dataclasses import dataclass
@@ -78,7 +79,7 @@ Key Components:
 Configuration Sources (in order of precedence):
     1. Explicit env_path argument to load_config()
     2. KMI_ENV_PATH environment variable
-    3. .env file in project root
+    3. .env file in the working directory, then in the project root
     4. Existing environment variables
     5. Default constants (DEFAULT_*)
 
@@ -88,17 +89,20 @@ Security Features:
     - File permission hardening option (KMI_ENFORCE_FILE_PERMS)
 """
 DEFAULT_KMI_USAGE_CACHE_SECONDS = 600
+DEFAULT_KMI_HEALTH_CACHE_TTL = 10
 DEFAULT_KMI_BLOCKLIST_RECHECK_SECONDS = 3600
 DEFAULT_KMI_BLOCKLIST_RECHECK_MAX = 3
 DEFAULT_KMI_FAIL_OPEN_ON_EMPTY_CACHE = True
 DEFAULT_KMI_ROTATE_INCLUDE_WARN = False
 
 
+TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
 def _parse_bool(value: Optional[str], default: bool) -> bool:
     if value is None:
         return default
-    value = value.strip().lower()
-    return value in {"1", "true", "yes", "on"}
+    return value.strip().lower() in TRUE_VALUES
 
 
 def _require_non_empty(name: str, value: str) -> str:
@@ -121,16 +125,29 @@ def _parse_allowlist(value: Optional[str]) -> tuple[str, ...]:
     return tuple(items)
 
 
+@dataclass(frozen=True)
+class _CompiledAllowlist:
+    exact: frozenset[str]
+    suffixes: tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_allowlist(allowlist: tuple[str, ...]) -> _CompiledAllowlist:
+    # Every auth file is validated against the same tuple, so split it into
+    # exact hosts and "*." suffixes once rather than per lookup.
+    exact = frozenset(
+        entry.lower() for entry in allowlist if not entry.startswith("*.")
+    )
+    suffixes = tuple(entry[1:].lower() for entry in allowlist if entry.startswith("*."))
+    return _CompiledAllowlist(exact=exact, suffixes=suffixes)
+
+
 def _host_allowed(host: str, allowlist: tuple[str, ...]) -> bool:
     if not allowlist:
         return True
+    compiled = _compile_allowlist(tuple(allowlist))
     host = host.lower()
-    for entry in allowlist:
-        if entry.startswith("*.") and host.endswith(entry[1:].lower()):
-            return True
-        if host == entry:
-            return True
-    return False
+    return host in compiled.exact or host.endswith(compiled.suffixes)
 
 
 def validate_base_url(name: str, value: str, allowlist: tuple[str, ...]) -> str:
@@ -146,12 +163,19 @@ def validate_base_url(name: str, value: str, allowlist: tuple[str, ...]) -> str:
     return value.rstrip("/")
 
 
+# <project root>/.env for a source checkout (``pip install -e .``), so it is
+# found whatever the working directory is.
+_PROJECT_ENV_PATH = Path(__file__).resolve().parents[2] / ".env"
+
+
 def _resolve_env_path() -> Optional[Path]:
     override = os.getenv("KMI_ENV_PATH")
     if override:
         return Path(override).expanduser()
-    candidate = Path(".env")
-    return candidate if candidate.exists() else None
+    for candidate in (Path(".env"), _PROJECT_ENV_PATH):
+        if candidate.exists():
+            return candidate
+    return None
 
 
 @dataclass(frozen=True)
@@ -188,12 +212,16 @@ class Config:
     payment_block_seconds: int = DEFAULT_KMI_PAYMENT_BLOCK_SECONDS
     require_usage_before_request: bool = DEFAULT_KMI_REQUIRE_USAGE_BEFORE_REQUEST
     usage_cache_seconds: int = DEFAULT_KMI_USAGE_CACHE_SECONDS
+    health_cache_ttl_seconds: int = DEFAULT_KMI_HEALTH_CACHE_TTL
     blocklist_recheck_seconds: int = DEFAULT_KMI_BLOCKLIST_RECHECK_SECONDS
     blocklist_recheck_max: int = DEFAULT_KMI_BLOCKLIST_RECHECK_MAX
     fail_open_on_empty_cache: bool = DEFAULT_KMI_FAIL_OPEN_ON_EMPTY_CACHE
     rotate_include_warn: bool = DEFAULT_KMI_ROTATE_INCLUDE_WARN
 
 
+_HOME_AUTHS_DIR = "~/.kimi/_auths"
+
+
 def _resolve_auths_dir() -> Path:
     env_val = os.getenv("KMI_AUTHS_DIR")
     if env_val:
@@ -201,112 +229,168 @@ def _resolve_auths_dir() -> Path:
     candidate = Path(DEFAULT_KMI_AUTHS_DIR).expanduser()
     if candidate.exists():
         return candidate
-    home_candidate = Path("~/.kimi/_auths").expanduser()
+    home_candidate = Path(_HOME_AUTHS_DIR).expanduser()
     if home_candidate.exists():
         return home_candidate
     return candidate
 
 
+_CONFIG_CACHE_MAX = 4
+_config_cache: dict[tuple, Config] = {}
+
+
+def _config_cache_key(env_path: Optional[Path]) -> tuple:
+    resolved = env_path if env_path is not None else _resolve_env_path()
+    env_file = None
+    if resolved is not None:
+        try:
+            st = resolved.stat()
+            env_file = (str(resolved), st.st_mtime_ns, st.st_size)
+        except OSError:
+            env_file = (str(resolved), None, None)
+    kmi_env = tuple(
+        sorted(item for item in os.environ.items() if item[0].startswith("KMI_"))
+    )
+    # Paths are expanded against the home directory, and without
+    # KMI_AUTHS_DIR the auths dir depends on which default dir exists.
+    home = os.path.expanduser("~")
+    auths_candidates = (
+        Path(DEFAULT_KMI_AUTHS_DIR).exists(),
+        Path(_HOME_AUTHS_DIR).expanduser().exists(),
+    )
+    return env_path is not None, env_file, os.getcwd(), home, auths_candidates, kmi_env
+
+
 def load_config(env_path: Optional[Path] = None) -> Config:
+    """Load and validate the configuration.
+
+    Results are memoised per process on everything the load reads: the env
+    file's (mtime, size), the KMI_* environment, the working directory, the
+    home directory and whether the default auths dirs exist. Repeat calls
+    therefore skip dotenv parsing and validation, and any change to those
+    inputs still produces a fresh Config.
+    """
+    key = _config_cache_key(env_path)
+    config = _config_cache.get(key)
+    if config is not None:
+        return config
+    config = _load_config(env_path)
+    _remember_config(key, config)
+    # The env file has now been applied to os.environ; loading it again would
+    # leave the environment and the result unchanged, so cache that state too.
+    _remember_config(_config_cache_key(env_path), config)
+    return config
+
+
+def _remember_config(key: tuple, config: Config) -> None:
+    if key not in _config_cache and len(_config_cache) >= _CONFIG_CACHE_MAX:
+        _config_cache.pop(next(iter(_config_cache)))
+    _config_cache[key] = config
+
+
+def _load_config(env_path: Optional[Path]) -> Config:
     explicit_env = env_path is not None or bool(os.getenv("KMI_ENV_PATH"))
     if env_path is None:
         env_path = _resolve_env_path()
     if env_path is not None:
         # Explicit env files (argument or KMI_ENV_PATH) should override existing env vars.
         load_dotenv(env_path, override=explicit_env)
-    else:
-        load_dotenv()
+    # Without one, the real environment is all there is; ./.env and the
+    # project root's .env are checked directly instead of walking parents.
+    # Read every setting from one snapshot taken after the env file is applied.
+    env = os.environ.copy()
 
     auths_dir = _resolve_auths_dir()
     proxy_listen = _require_non_empty(
-        "KMI_PROXY_LISTEN", os.getenv("KMI_PROXY_LISTEN", DEFAULT_KMI_PROXY_LISTEN)
+        "KMI_PROXY_LISTEN", env.get("KMI_PROXY_LISTEN", DEFAULT_KMI_PROXY_LISTEN)
     )
     proxy_base_path = _normalize_base_path(
-        os.getenv("KMI_PROXY_BASE_PATH", DEFAULT_KMI_PROXY_BASE_PATH)
+        env.get("KMI_PROXY_BASE_PATH", DEFAULT_KMI_PROXY_BASE_PATH)
     )
     upstream_allowlist = _parse_allowlist(
-        os.getenv("KMI_UPSTREAM_ALLOWLIST", DEFAULT_KMI_UPSTREAM_ALLOWLIST)
+        env.get("KMI_UPSTREAM_ALLOWLIST", DEFAULT_KMI_UPSTREAM_ALLOWLIST)
     )
     upstream_base_url = validate_base_url(
         "KMI_UPSTREAM_BASE_URL",
-        os.getenv("KMI_UPSTREAM_BASE_URL", DEFAULT_KMI_UPSTREAM_BASE_URL),
+        env.get("KMI_UPSTREAM_BASE_URL", DEFAULT_KMI_UPSTREAM_BASE_URL),
         upstream_allowlist,
     )
-    state_dir = Path(os.getenv("KMI_STATE_DIR", DEFAULT_KMI_STATE_DIR)).expanduser()
-    dry_run = _parse_bool(os.getenv("KMI_DRY_RUN"), DEFAULT_KMI_DRY_RUN)
+    state_dir = Path(env.get("KMI_STATE_DIR", DEFAULT_KMI_STATE_DIR)).expanduser()
+    dry_run = _parse_bool(env.get("KMI_DRY_RUN"), DEFAULT_KMI_DRY_RUN)
     auto_rotate_allowed = _parse_bool(
-        os.getenv("KMI_AUTO_ROTATE_ALLOWED"), DEFAULT_KMI_AUTO_ROTATE_ALLOWED
+        env.get("KMI_AUTO_ROTATE_ALLOWED"), DEFAULT_KMI_AUTO_ROTATE_ALLOWED
     )
     auto_rotate_e2e = _parse_bool(
-        os.getenv("KMI_AUTO_ROTATE_E2E"), DEFAULT_KMI_AUTO_ROTATE_E2E
+        env.get("KMI_AUTO_ROTATE_E2E"), DEFAULT_KMI_AUTO_ROTATE_E2E
     )
     cooldown = int(
-        os.getenv(
+        env.get(
             "KMI_ROTATION_COOLDOWN_SECONDS", str(DEFAULT_KMI_ROTATION_COOLDOWN_SECONDS)
         )
     )
     proxy_allow_remote = _parse_bool(
-        os.getenv("KMI_PROXY_ALLOW_REMOTE"), DEFAULT_KMI_PROXY_ALLOW_REMOTE
+        env.get("KMI_PROXY_ALLOW_REMOTE"), DEFAULT_KMI_PROXY_ALLOW_REMOTE
     )
-    proxy_token = os.getenv("KMI_PROXY_TOKEN", DEFAULT_KMI_PROXY_TOKEN)
+    proxy_token = env.get("KMI_PROXY_TOKEN", DEFAULT_KMI_PROXY_TOKEN)
     proxy_require_tls = _parse_bool(
-        os.getenv("KMI_PROXY_REQUIRE_TLS"), DEFAULT_KMI_PROXY_REQUIRE_TLS
+        env.get("KMI_PROXY_REQUIRE_TLS"), DEFAULT_KMI_PROXY_REQUIRE_TLS
     )
     proxy_tls_terminated = _parse_bool(
-        os.getenv("KMI_PROXY_TLS_TERMINATED"), DEFAULT_KMI_PROXY_TLS_TERMINATED
+        env.get("KMI_PROXY_TLS_TERMINATED"), DEFAULT_KMI_PROXY_TLS_TERMINATED
     )
-    proxy_max_rps = int(os.getenv("KMI_PROXY_MAX_RPS", str(DEFAULT_KMI_PROXY_MAX_RPS)))
-    proxy_max_rpm = int(os.getenv("KMI_PROXY_MAX_RPM", str(DEFAULT_KMI_PROXY_MAX_RPM)))
+    proxy_max_rps = int(env.get("KMI_PROXY_MAX_RPS", str(DEFAULT_KMI_PROXY_MAX_RPS)))
+    proxy_max_rpm = int(env.get("KMI_PROXY_MAX_RPM", str(DEFAULT_KMI_PROXY_MAX_RPM)))
     proxy_max_rps_per_key = int(
-        os.getenv("KMI_PROXY_MAX_RPS_PER_KEY", str(DEFAULT_KMI_PROXY_MAX_RPS_PER_KEY))
+        env.get("KMI_PROXY_MAX_RPS_PER_KEY", str(DEFAULT_KMI_PROXY_MAX_RPS_PER_KEY))
     )
     proxy_max_rpm_per_key = int(
-        os.getenv("KMI_PROXY_MAX_RPM_PER_KEY", str(DEFAULT_KMI_PROXY_MAX_RPM_PER_KEY))
+        env.get("KMI_PROXY_MAX_RPM_PER_KEY", str(DEFAULT_KMI_PROXY_MAX_RPM_PER_KEY))
     )
     proxy_retry_max = int(
-        os.getenv("KMI_PROXY_RETRY_MAX", str(DEFAULT_KMI_PROXY_RETRY_MAX))
+        env.get("KMI_PROXY_RETRY_MAX", str(DEFAULT_KMI_PROXY_RETRY_MAX))
     )
     proxy_retry_base_ms = int(
-        os.getenv("KMI_PROXY_RETRY_BASE_MS", str(DEFAULT_KMI_PROXY_RETRY_BASE_MS))
+        env.get("KMI_PROXY_RETRY_BASE_MS", str(DEFAULT_KMI_PROXY_RETRY_BASE_MS))
     )
-    trace_max_mb = int(os.getenv("KMI_TRACE_MAX_MB", str(DEFAULT_KMI_TRACE_MAX_MB)))
+    trace_max_mb = int(env.get("KMI_TRACE_MAX_MB", str(DEFAULT_KMI_TRACE_MAX_MB)))
     trace_max_backups = int(
-        os.getenv("KMI_TRACE_BACKUPS", str(DEFAULT_KMI_TRACE_BACKUPS))
+        env.get("KMI_TRACE_BACKUPS", str(DEFAULT_KMI_TRACE_BACKUPS))
     )
-    log_max_mb = int(os.getenv("KMI_LOG_MAX_MB", str(DEFAULT_KMI_LOG_MAX_MB)))
-    log_max_backups = int(os.getenv("KMI_LOG_BACKUPS", str(DEFAULT_KMI_LOG_BACKUPS)))
-    write_config = _parse_bool(os.getenv("KMI_WRITE_CONFIG"), DEFAULT_KMI_WRITE_CONFIG)
-    rotate_on_tie = _parse_bool(
-        os.getenv("KMI_ROTATE_ON_TIE"), DEFAULT_KMI_ROTATE_ON_TIE
-    )
-    time_zone = os.getenv("KMI_TIMEZONE", DEFAULT_KMI_TIMEZONE)
+    log_max_mb = int(env.get("KMI_LOG_MAX_MB", str(DEFAULT_KMI_LOG_MAX_MB)))
+    log_max_backups = int(env.get("KMI_LOG_BACKUPS", str(DEFAULT_KMI_LOG_BACKUPS)))
+    write_config = _parse_bool(env.get("KMI_WRITE_CONFIG"), DEFAULT_KMI_WRITE_CONFIG)
+    rotate_on_tie = _parse_bool(env.get("KMI_ROTATE_ON_TIE"), DEFAULT_KMI_ROTATE_ON_TIE)
+    time_zone = env.get("KMI_TIMEZONE", DEFAULT_KMI_TIMEZONE)
     enforce_file_perms = _parse_bool(
-        os.getenv("KMI_ENFORCE_FILE_PERMS"), DEFAULT_KMI_ENFORCE_FILE_PERMS
+        env.get("KMI_ENFORCE_FILE_PERMS"), DEFAULT_KMI_ENFORCE_FILE_PERMS
     )
     payment_block_seconds = int(
-        os.getenv("KMI_PAYMENT_BLOCK_SECONDS", str(DEFAULT_KMI_PAYMENT_BLOCK_SECONDS))
+        env.get("KMI_PAYMENT_BLOCK_SECONDS", str(DEFAULT_KMI_PAYMENT_BLOCK_SECONDS))
     )
     require_usage_before_request = _parse_bool(
-        os.getenv("KMI_REQUIRE_USAGE_BEFORE_REQUEST"),
+        env.get("KMI_REQUIRE_USAGE_BEFORE_REQUEST"),
         DEFAULT_KMI_REQUIRE_USAGE_BEFORE_REQUEST,
     )
     usage_cache_seconds = int(
-        os.getenv("KMI_USAGE_CACHE_SECONDS", str(DEFAULT_KMI_USAGE_CACHE_SECONDS))
+        env.get("KMI_USAGE_CACHE_SECONDS", str(DEFAULT_KMI_USAGE_CACHE_SECONDS))
+    )
+    health_cache_ttl_seconds = int(
+        env.get("KMI_HEALTH_CACHE_TTL", str(DEFAULT_KMI_HEALTH_CACHE_TTL))
     )
     blocklist_recheck_seconds = int(
-        os.getenv(
+        env.get(
             "KMI_BLOCKLIST_RECHECK_SECONDS", str(DEFAULT_KMI_BLOCKLIST_RECHECK_SECONDS)
         )
     )
     blocklist_recheck_max = int(
-        os.getenv("KMI_BLOCKLIST_RECHECK_MAX", str(DEFAULT_KMI_BLOCKLIST_RECHECK_MAX))
+        env.get("KMI_BLOCKLIST_RECHECK_MAX", str(DEFAULT_KMI_BLOCKLIST_RECHECK_MAX))
     )
     fail_open_on_empty_cache = _parse_bool(
-        os.getenv("KMI_FAIL_OPEN_ON_EMPTY_CACHE"),
+        env.get("KMI_FAIL_OPEN_ON_EMPTY_CACHE"),
         DEFAULT_KMI_FAIL_OPEN_ON_EMPTY_CACHE,
     )
     rotate_include_warn = _parse_bool(
-        os.getenv("KMI_ROTATE_INCLUDE_WARN"),
+        env.get("KMI_ROTATE_INCLUDE_WARN"),
         DEFAULT_KMI_ROTATE_INCLUDE_WARN,
     )
 
@@ -343,6 +427,7 @@ def load_config(env_path: Optional[Path] = None) -> Config:
         payment_block_seconds=payment_block_seconds,
         require_usage_before_request=require_usage_before_request,
         usage_cache_seconds=usage_cache_seconds,
+        health_cache_ttl_seconds=max(health_cache_ttl_seconds, 0),
         blocklist_recheck_seconds=blocklist_recheck_seconds,
         blocklist_recheck_max=blocklist_recheck_max,
         fail_open_on_empty_cache=fail_open_on_empty_cache,
@@ -1,24 +1,36 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
 import json
 import os
 import socket
+import stat
+import time
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from rich.console import Group
 from rich.panel import Panel
 from rich.text import Text
 
-from kmi_manager_cli.auth_accounts import collect_auth_files
+from kmi_manager_cli.auth_accounts import accounts_manifest_path, collect_auth_files
 from kmi_manager_cli.config import Config
-from kmi_manager_cli.health import fetch_usage
-from kmi_manager_cli.keys import load_auths_dir
+from kmi_manager_cli.health import (
+    HEALTH_MAX_WORKERS,
+    fetch_usage,
+    get_http_client,
+    usage_cache_path,
+)
+from kmi_manager_cli.keys import Registry, load_auths_dir
 from kmi_manager_cli.logging import get_logger
 from kmi_manager_cli.rotation import clear_blocked, is_blocked
-from kmi_manager_cli.security import is_insecure_permissions
+from kmi_manager_cli.security import is_insecure_mode
 from kmi_manager_cli.state import load_state, save_state
 from kmi_manager_cli.proxy_utils import (
     normalize_connect_host,
@@ -58,21 +70,33 @@ def _format_age(seconds: float) -> str:
     return f"{int(seconds // 3600)}h ago"
 
 
-def _file_status(path: Path, label: str) -> DoctorCheck:
-    if not path.exists():
+def _file_status(path: Path, label: str, now: Optional[float] = None) -> DoctorCheck:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return DoctorCheck(
             label, "warn", "missing", "Run requests through proxy to create it."
         )
-    mtime = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
-    age = _format_age((datetime.now(timezone.utc) - mtime).total_seconds())
-    size_kb = max(1, int(path.stat().st_size / 1024))
+    if now is None:
+        now = time.time()
+    age = _format_age(now - st.st_mtime)
+    size_kb = max(1, int(st.st_size / 1024))
     return DoctorCheck(label, "ok", f"updated {age}, {size_kb}KB")
 
 
+def _stat_mode(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mode
+    except FileNotFoundError:
+        return None
+
+
 def _collect_insecure(paths: Iterable[Path]) -> list[str]:
     insecure: list[str] = []
     for path in paths:
-        if path.exists() and is_insecure_permissions(path):
+        # One stat per path: missing paths are skipped, present ones checked.
+        mode = _stat_mode(path)
+        if mode is not None and is_insecure_mode(mode):
             insecure.append(str(path))
     return insecure
 
@@ -83,10 +107,15 @@ def _check_env(config: Config) -> DoctorCheck:
     return DoctorCheck("Env file", "info", "no .env found; using environment variables")
 
 
-def _check_auths(config: Config) -> DoctorCheck:
-    registry = load_auths_dir(
+def _load_registry(config: Config) -> Registry:
+    return load_auths_dir(
         config.auths_dir, config.upstream_base_url, config.upstream_allowlist
     )
+
+
+def _check_auths(config: Config, registry: Optional[Registry] = None) -> DoctorCheck:
+    if registry is None:
+        registry = _load_registry(config)
     count = len(registry.keys)
     if count == 0:
         return DoctorCheck(
@@ -166,16 +195,18 @@ def _check_kimi_env(config: Config) -> DoctorCheck:
 
 def _check_state(config: Config) -> DoctorCheck:
     state_path = config.state_dir.expanduser() / "state.json"
-    if not state_path.exists():
+    loads = orjson.loads if orjson is not None else json.loads
+    try:
+        # Parse the raw bytes; both parsers accept them, skipping a str decode.
+        data = loads(state_path.read_bytes())
+    except FileNotFoundError:
         return DoctorCheck(
             "State",
             "warn",
             f"missing {state_path}",
             "Run any kmi command to create it.",
         )
-    try:
-        data = json.loads(state_path.read_text())
-    except json.JSONDecodeError:
+    except ValueError:
         return DoctorCheck(
             "State",
             "fail",
@@ -194,18 +225,31 @@ def _check_permissions(config: Config) -> DoctorCheck:
     state_path = state_dir / "state.json"
     trace_path = trace_dir / "trace.jsonl"
     log_path = log_dir / "kmi.log"
+    cache_dir = state_dir / "cache"
+    # The auths dir's one stat answers both "is it a dir" and "is it loose".
+    insecure: list[str] = []
+    auths_mode = _stat_mode(auths_dir)
     paths: list[Path] = []
-    if auths_dir.exists():
-        paths.append(auths_dir)
-        paths.extend(collect_auth_files(auths_dir))
-    if state_dir.exists():
-        paths.append(state_dir)
-    if trace_dir.exists():
-        paths.append(trace_dir)
-    if log_dir.exists():
-        paths.append(log_dir)
-    paths.extend([state_path, trace_path, log_path])
-    insecure = _collect_insecure(paths)
+    if auths_mode is not None:
+        if is_insecure_mode(auths_mode):
+            insecure.append(str(auths_dir))
+        if stat.S_ISDIR(auths_mode):
+            paths.extend(collect_auth_files(auths_dir))
+    # Missing paths are skipped by _collect_insecure's own stat.
+    paths.extend(
+        [
+            state_dir,
+            trace_dir,
+            log_dir,
+            cache_dir,
+            state_path,
+            trace_path,
+            log_path,
+            accounts_manifest_path(state_dir),
+            usage_cache_path(config),
+        ]
+    )
+    insecure.extend(_collect_insecure(paths))
     if not insecure:
         return DoctorCheck("Permissions", "ok", "no insecure paths detected")
     shown = ", ".join(insecure[:3])
@@ -218,10 +262,14 @@ def _check_permissions(config: Config) -> DoctorCheck:
     )
 
 
-def collect_checks(config: Config) -> list[DoctorCheck]:
+def collect_checks(
+    config: Config, registry: Optional[Registry] = None
+) -> list[DoctorCheck]:
+    state_dir = config.state_dir.expanduser()
+    now = time.time()
     checks: list[DoctorCheck] = [
         _check_env(config),
-        _check_auths(config),
+        _check_auths(config, registry),
         DoctorCheck(
             "Dry run",
             "warn" if config.dry_run else "ok",
@@ -236,27 +284,38 @@ def collect_checks(config: Config) -> list[DoctorCheck]:
         _check_proxy(config),
         _check_kimi_env(config),
         _check_state(config),
-        _file_status(config.state_dir.expanduser() / "trace" / "trace.jsonl", "Trace"),
-        _file_status(config.state_dir.expanduser() / "logs" / "kmi.log", "Log"),
+        _file_status(state_dir / "trace" / "trace.jsonl", "Trace", now),
+        _file_status(state_dir / "logs" / "kmi.log", "Log", now),
         _check_permissions(config),
     ]
     return checks
 
 
 def _recheck_blocked_keys(config: Config, registry, state) -> tuple[int, int]:
+    blocked = [key for key in registry.keys if is_blocked(state, key.label)]
+    if not blocked:
+        return 0, 0
     logger = get_logger(config)
-    cleared = 0
-    remaining = 0
-    for key in registry.keys:
-        if not is_blocked(state, key.label):
-            continue
-        usage = fetch_usage(
+    client = get_http_client()
+
+    def fetch(key):
+        return fetch_usage(
             config.upstream_base_url,
             key.api_key,
             dry_run=False,
             logger=logger,
             label=key.label,
+            client=client,
         )
+
+    # Probe concurrently; state is only touched below, on this thread.
+    with ThreadPoolExecutor(
+        max_workers=min(HEALTH_MAX_WORKERS, len(blocked))
+    ) as executor:
+        usages = list(executor.map(fetch, blocked))
+    cleared = 0
+    remaining = 0
+    for key, usage in zip(blocked, usages):
         if usage is not None:
             clear_blocked(state, key.label)
             cleared += 1
@@ -269,7 +328,9 @@ def run_doctor(
     config: Config, recheck_keys: bool = False, clear_blocklist: bool = False
 ) -> int:
     console = get_console()
-    checks = collect_checks(config)
+    # Loaded once: the auth check and --recheck-keys/--clear-blocklist share it.
+    registry = _load_registry(config)
+    checks = collect_checks(config, registry)
     counts = {"ok": 0, "warn": 0, "fail": 0, "info": 0}
     for check in checks:
         counts[check.status] = counts.get(check.status, 0) + 1
@@ -296,9 +357,6 @@ def run_doctor(
     )
     console.print(summary)
     if recheck_keys or clear_blocklist:
-        registry = load_auths_dir(
-            config.auths_dir, config.upstream_base_url, config.upstream_allowlist
-        )
         state = load_state(config, registry)
         if clear_blocklist:
             cleared = clear_blocked(state)
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Optional
+import atexit
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import NamedTuple, Optional
 
 import httpx
 
 from kmi_manager_cli.auth_accounts import Account
 from kmi_manager_cli.config import Config
+from kmi_manager_cli.locking import atomic_write_private_text
 from kmi_manager_cli.logging import get_logger, log_event
 from kmi_manager_cli.keys import Registry
 from kmi_manager_cli.state import KeyState, State
@@ -32,6 +40,29 @@ The module handles multiple API response formats and normalizes them into
 a consistent structure for rotation decisions.
 """
 
+USAGE_TIMEOUT_SECONDS = 10.0
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+HEALTH_MAX_WORKERS = 16
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """Return the process-wide pooled client used for /usages requests.
+
+    Reusing one client keeps upstream connections alive between keys, so a
+    health refresh pays the TCP/TLS handshake once instead of per key.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                timeout=USAGE_TIMEOUT_SECONDS, limits=HTTP_LIMITS
+            )
+            atexit.register(_http_client.close)
+        return _http_client
+
 
 @dataclass
 class Usage:
@@ -55,8 +86,7 @@ class LimitInfo:
     window_hours: Optional[float]
 
 
-@dataclass
-class HealthInfo:
+class HealthInfo(NamedTuple):
     status: str
     remaining_percent: Optional[float]
     used: Optional[int]
@@ -158,12 +188,15 @@ def _window_hours(window: dict) -> Optional[float]:
     return None
 
 
-def _limit_label(item: dict, detail: dict, window: dict, idx: int) -> str:
+def _limit_label(
+    item: dict, detail: dict, window: dict, idx: int, hours: Optional[float] = None
+) -> str:
     for key in ("name", "title", "scope"):
         value = item.get(key) or detail.get(key)
         if value:
             return str(value)
-    hours = _window_hours(window)
+    if hours is None:
+        hours = _window_hours(window)
     if hours is not None:
         if hours >= 24 and hours % 24 == 0:
             return f"{int(hours // 24)}d limit"
@@ -181,21 +214,21 @@ def _parse_limits(payload: dict) -> list[LimitInfo]:
     for idx, item in enumerate(limits_raw):
         if not isinstance(item, dict):
             continue
-        detail = item.get("detail") if isinstance(item.get("detail"), dict) else item
-        window = item.get("window") if isinstance(item.get("window"), dict) else {}
-        label = _limit_label(item, detail, window, idx)
-        used = _to_int(detail.get("used"))
-        limit = _to_int(detail.get("limit"))
-        remaining = _to_int(detail.get("remaining"))
-        reset_hint = _extract_reset_hint(detail)
+        detail = item.get("detail")
+        if not isinstance(detail, dict):
+            detail = item
+        window = item.get("window")
+        if not isinstance(window, dict):
+            window = {}
+        window_hours = _window_hours(window)
         limits.append(
             LimitInfo(
-                label=label,
-                used=used,
-                limit=limit,
-                remaining=remaining,
-                reset_hint=reset_hint,
-                window_hours=_window_hours(window),
+                label=_limit_label(item, detail, window, idx, window_hours),
+                used=_to_int(detail.get("used")),
+                limit=_to_int(detail.get("limit")),
+                remaining=_to_int(detail.get("remaining")),
+                reset_hint=_extract_reset_hint(detail),
+                window_hours=window_hours,
             )
         )
     return limits
@@ -203,7 +236,14 @@ def _parse_limits(payload: dict) -> list[LimitInfo]:
 
 def _extract_usage_summary(
     payload: dict,
+    parsed_limits: Optional[list[LimitInfo]] = None,
 ) -> tuple[Optional[int], Optional[int], Optional[int], Optional[str]]:
+    """Return ``(used, limit, remaining, reset_hint)`` from ``usage``.
+
+    Missing fields fall back to the first ``limits`` entry. Pass the result of
+    ``_parse_limits`` as ``parsed_limits`` to reuse it instead of re-reading
+    that entry.
+    """
     usage = payload.get("usage") if isinstance(payload, dict) else None
     limits = payload.get("limits") if isinstance(payload, dict) else None
 
@@ -216,7 +256,20 @@ def _extract_usage_summary(
         remaining = _to_int(usage.get("remaining"))
         reset_hint = _extract_reset_hint(usage)
 
-    if isinstance(limits, list) and limits:
+    if (
+        parsed_limits
+        and isinstance(limits, list)
+        and limits
+        and isinstance(limits[0], dict)
+    ):
+        # _parse_limits only skips non-dicts, so this is limits[0] parsed.
+        first_parsed = parsed_limits[0]
+        used = used if used is not None else first_parsed.used
+        limit = limit if limit is not None else first_parsed.limit
+        remaining = remaining if remaining is not None else first_parsed.remaining
+        if reset_hint is None:
+            reset_hint = first_parsed.reset_hint
+    elif isinstance(limits, list) and limits:
         first = limits[0] if isinstance(limits[0], dict) else None
         if first:
             detail = (
@@ -239,6 +292,7 @@ def fetch_usage(
     dry_run: bool = False,
     logger=None,
     label: Optional[str] = None,
+    client: Optional[httpx.Client] = None,
 ) -> Optional[Usage]:
     if dry_run:
         return Usage(
@@ -251,9 +305,12 @@ def fetch_usage(
             raw={"dry_run": True},
         )
     url = base_url.rstrip("/") + "/usages"
+    get = client.get if client is not None else httpx.get
     try:
-        resp = httpx.get(
-            url, headers={"Authorization": f"Bearer {api_key}"}, timeout=10.0
+        resp = get(
+            url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=USAGE_TIMEOUT_SECONDS,
         )
         resp.raise_for_status()
         payload = resp.json() if resp.content else {}
@@ -267,9 +324,13 @@ def fetch_usage(
                 error=str(exc),
             )
         return None
+    return _parse_usage_payload(payload)
+
+
+def _parse_usage_payload(payload: dict) -> Usage:
     limits = _parse_limits(payload)
     email = _extract_email_from_payload(payload)
-    used, limit, remaining, reset_hint = _extract_usage_summary(payload)
+    used, limit, remaining, reset_hint = _extract_usage_summary(payload, limits)
     remaining_percent = _extract_remaining_percent(payload)
     if remaining_percent is None and remaining is not None and limit:
         remaining_percent = round((remaining / limit) * 100, 2)
@@ -341,19 +402,138 @@ def score_key(
     return "healthy"
 
 
+def _fetch_usages(
+    targets: list[tuple[str, str, str]],
+    *,
+    dry_run: bool,
+    logger,
+    client: Optional[httpx.Client],
+) -> list[Optional[Usage]]:
+    """Fetch usage for each ``(base_url, api_key, label)``, in order.
+
+    Live lookups run on a thread pool over the shared (thread-safe) client,
+    so a refresh takes about as long as the slowest key instead of the sum.
+    """
+    if client is None and not dry_run and targets:
+        client = get_http_client()
+
+    def fetch(target: tuple[str, str, str]) -> Optional[Usage]:
+        base_url, api_key, label = target
+        return fetch_usage(
+            base_url,
+            api_key,
+            dry_run=dry_run,
+            logger=logger,
+            label=label,
+            client=client,
+        )
+
+    if dry_run or len(targets) < 2:
+        return [fetch(target) for target in targets]
+    with ThreadPoolExecutor(
+        max_workers=min(HEALTH_MAX_WORKERS, len(targets))
+    ) as executor:
+        return list(executor.map(fetch, targets))
+
+
+def usage_cache_path(config: Config) -> Path:
+    return config.state_dir.expanduser() / "cache" / "health.json"
+
+
+def _usage_cache_key(base_url: str, api_key: str) -> str:
+    # One-way digest so the cache file never holds a usable key.
+    raw = f"{base_url}\0{api_key}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _usage_from_dict(data: dict) -> Usage:
+    limits = [LimitInfo(**item) for item in data.get("limits", [])]
+    return Usage(**{**data, "limits": limits})
+
+
+def _read_usage_cache(path: Path) -> dict[str, dict]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    entries = payload.get("entries") if isinstance(payload, dict) else None
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_usage_cache(path: Path, entries: dict[str, dict]) -> None:
+    try:
+        # Usage payloads can carry account emails; keep them owner-only.
+        atomic_write_private_text(
+            path, json.dumps({"entries": entries}, ensure_ascii=True) + "\n"
+        )
+    except (OSError, TypeError, ValueError):
+        return
+
+
+def _fetch_usages_cached(
+    config: Config,
+    targets: list[tuple[str, str, str]],
+    *,
+    dry_run: bool,
+    logger,
+    client: Optional[httpx.Client],
+    cache_ttl: float,
+) -> list[Optional[Usage]]:
+    """Like ``_fetch_usages``, reusing live results younger than ``cache_ttl``.
+
+    Entries are stored per (base_url, key) in ``usage_cache_path`` so every
+    health view shares them; failed lookups are never cached.
+    """
+    if cache_ttl <= 0 or dry_run:
+        return _fetch_usages(targets, dry_run=dry_run, logger=logger, client=client)
+    path = usage_cache_path(config)
+    now = time.time()
+    entries = {
+        key: entry
+        for key, entry in _read_usage_cache(path).items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("ts"), (int, float))
+        and 0 <= now - entry["ts"] < cache_ttl
+    }
+    keys = [_usage_cache_key(base_url, api_key) for base_url, api_key, _ in targets]
+    usages: list[Optional[Usage]] = [None] * len(targets)
+    missing: list[int] = []
+    for idx, key in enumerate(keys):
+        try:
+            usages[idx] = _usage_from_dict(entries[key]["usage"])
+        except (KeyError, TypeError):
+            missing.append(idx)
+    if not missing:
+        return usages
+    fetched = _fetch_usages(
+        [targets[idx] for idx in missing], dry_run=False, logger=logger, client=client
+    )
+    for idx, usage in zip(missing, fetched):
+        usages[idx] = usage
+        if usage is not None:
+            entries[keys[idx]] = {"ts": now, "usage": asdict(usage)}
+    _write_usage_cache(path, entries)
+    return usages
+
+
 def get_health_map(
-    config: Config, registry: Registry, state: State
+    config: Config,
+    registry: Registry,
+    state: State,
+    client: Optional[httpx.Client] = None,
+    cache_ttl: float = 0,
 ) -> dict[str, HealthInfo]:
     health: dict[str, HealthInfo] = {}
     logger = get_logger(config)
-    for key in registry.keys:
-        usage = fetch_usage(
-            config.upstream_base_url,
-            key.api_key,
-            dry_run=config.dry_run,
-            logger=logger,
-            label=key.label,
-        )
+    usages = _fetch_usages_cached(
+        config,
+        [(config.upstream_base_url, key.api_key, key.label) for key in registry.keys],
+        dry_run=config.dry_run,
+        logger=logger,
+        client=client,
+        cache_ttl=cache_ttl,
+    )
+    for key, usage in zip(registry.keys, usages):
         key_state = state.keys.get(key.label, KeyState())
         total = max(key_state.request_count, 1)
         error_rate = (
@@ -377,18 +557,34 @@ def get_health_map(
 
 
 def get_accounts_health(
-    config: Config, accounts: list[Account], state: State, force_real: bool = False
+    config: Config,
+    accounts: list[Account],
+    state: State,
+    force_real: bool = False,
+    client: Optional[httpx.Client] = None,
+    cache_ttl: float = 0,
 ) -> dict[str, HealthInfo]:
+    """Build health info for ``accounts``, keyed by account id.
+
+    With ``cache_ttl`` > 0, /usages results fetched by any health view within
+    the last ``cache_ttl`` seconds are reused; key state is always applied
+    fresh.
+    """
     health: dict[str, HealthInfo] = {}
     logger = get_logger(config)
-    for account in accounts:
-        usage = fetch_usage(
-            account.base_url,
-            account.api_key,
-            dry_run=(False if force_real else config.dry_run),
-            logger=logger,
-            label=account.label,
-        )
+    dry_run = False if force_real else config.dry_run
+    targets = [
+        (account.base_url, account.api_key, account.label) for account in accounts
+    ]
+    usages = _fetch_usages_cached(
+        config,
+        targets,
+        dry_run=dry_run,
+        logger=logger,
+        client=client,
+        cache_ttl=cache_ttl,
+    )
+    for account, usage in zip(accounts, usages):
         key_state = state.keys.get(account.label, KeyState())
         total = max(key_state.request_count, 1)
         error_rate = (
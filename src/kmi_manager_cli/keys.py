@@ -21,6 +21,7 @@ Security:
 
 from __future__ import annotations
 
+import functools
 import hashlib
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -31,8 +32,9 @@ from dotenv import dotenv_values
 from kmi_manager_cli.auth_accounts import (
     collect_auth_files,
     load_accounts_from_auths_dir,
+    read_env_values,
 )
-from kmi_manager_cli.config import DEFAULT_KMI_UPSTREAM_BASE_URL
+from kmi_manager_cli.config import DEFAULT_KMI_UPSTREAM_BASE_URL, TRUE_VALUES
 from kmi_manager_cli.security import warn_if_insecure
 
 
@@ -65,7 +67,7 @@ Security:
 def _parse_bool(value: Optional[str]) -> bool:
     if value is None:
         return False
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    return value.strip().lower() in TRUE_VALUES
 
 
 def mask_key(api_key: str) -> str:
@@ -76,23 +78,36 @@ def mask_key(api_key: str) -> str:
     return f"{api_key[:4]}***{api_key[-4:]}"
 
 
+@functools.lru_cache(maxsize=512)
+def _key_hash(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
 @dataclass(frozen=True)
 class KeyRecord:
     label: str
     api_key: str
     priority: int = 0
     disabled: bool = False
-    key_hash: str = field(init=False)
 
-    def __post_init__(self) -> None:
-        digest = hashlib.sha256(self.api_key.encode("utf-8")).hexdigest()
-        object.__setattr__(self, "key_hash", digest[:12])
+    @property
+    def key_hash(self) -> str:
+        # Only trace entries need it; hash on first use, once per key.
+        return _key_hash(self.api_key)
 
 
 @dataclass
 class Registry:
     keys: list[KeyRecord]
     active_index: int = 0
+    _by_label: dict[str, KeyRecord] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        # The proxy looks a key up by label on every request. Reversed so
+        # the first record wins when labels repeat, as the old scan did.
+        self._by_label = {key.label: key for key in reversed(self.keys)}
 
     @property
     def active_key(self) -> Optional[KeyRecord]:
@@ -102,10 +117,7 @@ class Registry:
         return self.keys[idx]
 
     def find_by_label(self, label: str) -> Optional[KeyRecord]:
-        for key in self.keys:
-            if key.label == label:
-                return key
-        return None
+        return self._by_label.get(label)
 
 
 def load_env_file(path: Path) -> dict[str, str]:
@@ -113,11 +125,37 @@ def load_env_file(path: Path) -> dict[str, str]:
     return {k: v for k, v in data.items() if v is not None}
 
 
+@functools.lru_cache(maxsize=256)
+def _env_meta_cached(path_str: str, mtime_ns: int, size: int) -> tuple[int, bool]:
+    # Only two keys are needed; the auth loader's minimal reader is enough
+    # and much cheaper than dotenv's full parser.
+    data = read_env_values(Path(path_str))
+    try:
+        priority = int(data.get("KMI_KEY_PRIORITY", "0"))
+    except ValueError:
+        priority = 0
+    return priority, _parse_bool(data.get("KMI_KEY_DISABLED"))
+
+
+def _env_meta(path: Path) -> tuple[int, bool]:
+    """Return ``(priority, disabled)`` for an auth .env file.
+
+    Parsed once per (mtime, size), so commands that build the registry more
+    than once only re-stat the files.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return 0, False
+    return _env_meta_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
 def load_auths_dir(
     auths_dir: Path,
     default_base_url: str = DEFAULT_KMI_UPSTREAM_BASE_URL,
     allowlist: tuple[str, ...] = (),
     logger=None,
+    manifest_path: Optional[Path] = None,
 ) -> Registry:
     auths_dir = auths_dir.expanduser()
     if not auths_dir.exists():
@@ -130,16 +168,11 @@ def load_auths_dir(
             warn_if_insecure(path, logger, "auth_file")
         if path.suffix.lower() != ".env":
             continue
-        data = load_env_file(path)
-        priority_raw = data.get("KMI_KEY_PRIORITY", "0")
-        try:
-            priority = int(priority_raw)
-        except ValueError:
-            priority = 0
-        disabled = _parse_bool(data.get("KMI_KEY_DISABLED"))
-        env_meta[str(path)] = (priority, disabled)
-
-    accounts = load_accounts_from_auths_dir(auths_dir, default_base_url, allowlist)
+        env_meta[str(path)] = _env_meta(path)
+
+    accounts = load_accounts_from_auths_dir(
+        auths_dir, default_base_url, allowlist, manifest_path=manifest_path
+    )
     seen_keys: set[str] = set()
     for account in accounts:
         if not account.api_key or account.api_key in seen_keys:
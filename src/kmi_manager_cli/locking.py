@@ -51,3 +51,20 @@ def atomic_write_text(path: Path, content: str) -> None:
     tmp_path = path.with_suffix(path.suffix + ".tmp")
     tmp_path.write_text(content, encoding="utf-8")
     os.replace(tmp_path, path)
+
+
+def atomic_write_private_text(path: Path, content: str) -> None:
+    """Like ``atomic_write_text``, but for files holding secrets.
+
+    The temp file is created 0600 before any content is written, and a parent
+    directory created here is 0700, so the data is never readable by others.
+    """
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        if os.name != "nt":
+            # O_CREAT leaves the mode of a stale temp file untouched.
+            os.fchmod(handle.fileno(), 0o600)
+        handle.write(content)
+    os.replace(tmp_path, path)
@@ -11,7 +11,7 @@ import uuid
 from collections import deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Deque, Iterable, Optional, Tuple, TYPE_CHECKING
+from typing import Deque, Iterable, Optional, TYPE_CHECKING
 
 import httpx
 from fastapi import FastAPI, Request, Response
@@ -22,6 +22,7 @@ from kmi_manager_cli.config import Config
 from kmi_manager_cli.errors import remediation_message
 from kmi_manager_cli.keys import Registry
 from kmi_manager_cli.logging import get_logger, log_event
+from kmi_manager_cli.proxy_utils import parse_listen
 from kmi_manager_cli.health import fetch_usage, get_health_map
 from kmi_manager_cli.rotation import (
     clear_blocked,
@@ -35,6 +36,7 @@ from kmi_manager_cli.trace import append_trace, trace_now_str
 
 if TYPE_CHECKING:
     from kmi_manager_cli.health import HealthInfo
+    import uvicorn
 
 
 """FastAPI-based async proxy server for request forwarding.
@@ -548,13 +550,6 @@ class KeyedRateLimiter:
             return True
 
 
-def parse_listen(listen: str) -> Tuple[str, int]:
-    if ":" not in listen:
-        raise ValueError("KMI_PROXY_LISTEN must be in host:port format")
-    host, port_raw = listen.rsplit(":", 1)
-    return host, int(port_raw)
-
-
 def _build_upstream_url(config: Config, path: str, query: str) -> str:
     base = config.upstream_base_url.rstrip("/")
     path = path.lstrip("/")
@@ -885,9 +880,7 @@ def create_app(config: Config, registry: Registry, state: State) -> FastAPI:
     return app
 
 
-def run_proxy(config: Config, registry: Registry, state: State) -> None:
-    import uvicorn
-
+def _check_bind_policy(config: Config) -> tuple[str, int]:
     host, port = parse_listen(config.proxy_listen)
     if not _is_local_host(host) and not config.proxy_allow_remote:
         raise ValueError(
@@ -906,5 +899,36 @@ def run_proxy(config: Config, registry: Registry, state: State) -> None:
         raise ValueError(
             "Remote proxy binding requires KMI_PROXY_TOKEN for authentication."
         )
+    return host, port
+
+
+def run_proxy(config: Config, registry: Registry, state: State) -> None:
+    import uvicorn
+
+    host, port = _check_bind_policy(config)
     app = create_app(config, registry, state)
     uvicorn.run(app, host=host, port=port, lifespan="on")
+
+
+def create_proxy_server(
+    config: Config, registry: Registry, state: State
+) -> "uvicorn.Server":
+    """Build a quiet uvicorn server for running the proxy inside this process.
+
+    Call ``run()`` on a worker thread and set ``should_exit`` to stop it; the
+    lifespan shutdown still flushes pending state and trace writes.
+    """
+    import uvicorn
+
+    host, port = _check_bind_policy(config)
+    app = create_app(config, registry, state)
+    return uvicorn.Server(
+        uvicorn.Config(
+            app,
+            host=host,
+            port=port,
+            lifespan="on",
+            log_level="warning",
+            access_log=False,
+        )
+    )
@@ -4,30 +4,94 @@ This module provides common utilities for working with proxy connections
 that are used by both the CLI and doctor modules.
 """
 
+import ipaddress
 import socket
+import time
 from pathlib import Path
 
 from kmi_manager_cli.config import Config
-from kmi_manager_cli.proxy import parse_listen
 
 
-def proxy_listening(host: str, port: int) -> bool:
+LISTEN_PROBE_TTL_SECONDS = 2.0
+LISTEN_PROBE_TIMEOUT_SECONDS = 0.5
+LOOPBACK_PROBE_TIMEOUT_SECONDS = 0.05
+_listen_cache: dict[tuple[str, int], tuple[float, bool]] = {}
+
+
+def proxy_listening(host: str, port: int, *, force: bool = False) -> bool:
     """Check if a proxy is listening on the given host:port.
     
+    Results are cached per (host, port) for LISTEN_PROBE_TTL_SECONDS so
+    repeated checks within one command don't reconnect each time.
+
     Args:
         host: Hostname or IP address
         port: Port number
+        force: Skip the cache and probe again (use after starting/stopping)
         
     Returns:
         True if a connection can be established, False otherwise
     """
+    key = (host, port)
+    now = time.monotonic()
+    if not force:
+        cached = _listen_cache.get(key)
+        if cached is not None and now - cached[0] < LISTEN_PROBE_TTL_SECONDS:
+            return cached[1]
+    listening = _probe(host, port)
+    _listen_cache[key] = (now, listening)
+    return listening
+
+
+def _probe(host: str, port: int) -> bool:
+    try:
+        addresses = [(ipaddress.ip_address(host), (host, port))]
+    except ValueError:
+        # Hostnames (e.g. "localhost") resolve to one or more addresses; probe
+        # each so loopback ones still get the short timeout.
+        try:
+            infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError:
+            return False
+        addresses = [
+            (ipaddress.ip_address(sockaddr[0].split("%", 1)[0]), sockaddr)
+            for _family, _type, _proto, _canon, sockaddr in infos
+        ]
+    return any(_connect(address, sockaddr) for address, sockaddr in addresses)
+
+
+def _connect(address, sockaddr: tuple) -> bool:
+    # connect_ex on a bare socket: no getaddrinfo, no exception on refusal;
+    # loopback answers (or refuses) at once.
+    family = socket.AF_INET6 if address.version == 6 else socket.AF_INET
+    timeout = (
+        LOOPBACK_PROBE_TIMEOUT_SECONDS
+        if address.is_loopback
+        else LISTEN_PROBE_TIMEOUT_SECONDS
+    )
     try:
-        with socket.create_connection((host, port), timeout=0.5):
-            return True
+        with socket.socket(family, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            return sock.connect_ex(sockaddr) == 0
     except OSError:
         return False
 
 
+def parse_listen(listen: str) -> tuple[str, int]:
+    """Split a ``host:port`` listen string.
+
+    Lives here rather than in proxy.py so callers that only need the address
+    do not import FastAPI.
+
+    Raises:
+        ValueError: If the value has no port separator or a non-numeric port
+    """
+    if ":" not in listen:
+        raise ValueError("KMI_PROXY_LISTEN must be in host:port format")
+    host, port_raw = listen.rsplit(":", 1)
+    return host, int(port_raw)
+
+
 def normalize_connect_host(host: str) -> str:
     """Normalize host for client connections.
     
@@ -59,6 +123,27 @@ def proxy_base_url(config: Config) -> str:
     return f"{scheme}://{host}:{port}{config.proxy_base_path}"
 
 
+_log_dir_cache: dict[Path, Path] = {}
+
+
+def state_log_dir(config: Config) -> Path:
+    """Get the logs directory under the state dir, creating it once per process.
+    
+    Args:
+        config: Configuration object
+        
+    Returns:
+        Path to the logs directory
+    """
+    state_dir = config.state_dir
+    log_dir = _log_dir_cache.get(state_dir)
+    if log_dir is None:
+        log_dir = state_dir.expanduser() / "logs"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        _log_dir_cache[state_dir] = log_dir
+    return log_dir
+
+
 def proxy_daemon_log_path(config: Config) -> Path:
     """Get the path to the proxy daemon log file.
     
@@ -68,9 +153,7 @@ def proxy_daemon_log_path(config: Config) -> Path:
     Returns:
         Path to the daemon log file
     """
-    log_dir = config.state_dir.expanduser() / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
-    return log_dir / "proxy.out"
+    return state_log_dir(config) / "proxy.out"
 
 
 def proxy_pid_path(config: Config) -> Path:
@@ -5,6 +5,12 @@ import stat
 from pathlib import Path
 
 
+def is_insecure_mode(mode: int) -> bool:
+    if os.name == "nt":
+        return False
+    return bool(mode & (stat.S_IRWXG | stat.S_IRWXO))
+
+
 def is_insecure_permissions(path: Path) -> bool:
     if os.name == "nt":
         return False
@@ -12,7 +18,7 @@ def is_insecure_permissions(path: Path) -> bool:
         mode = path.stat().st_mode
     except FileNotFoundError:
         return False
-    return bool(mode & (stat.S_IRWXG | stat.S_IRWXO))
+    return is_insecure_mode(mode)
 
 
 def warn_if_insecure(path: Path, logger, label: str) -> None:
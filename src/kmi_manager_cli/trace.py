@@ -5,7 +5,7 @@ import os
 from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Mapping
 
 from kmi_manager_cli.config import Config
 from kmi_manager_cli.locking import file_lock
@@ -118,14 +118,13 @@ def load_trace_entries(path: Path, window: int = 200) -> list[dict]:
 
 
 def compute_confidence(entries: Iterable[dict]) -> float:
-    entries = list(entries)
-    if not entries:
+    counts, total = compute_distribution(entries)
+    return confidence_from_counts(counts, total)
+
+
+def confidence_from_counts(counts: Mapping[str, int], total: int) -> float:
+    if not total:
         return 100.0
-    counts: dict[str, int] = {}
-    for entry in entries:
-        label = entry.get("key_label", "unknown")
-        counts[label] = counts.get(label, 0) + 1
-    total = len(entries)
     num_keys = max(len(counts), 1)
     expected = total / num_keys
     if expected == 0:
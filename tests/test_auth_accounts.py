@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from kmi_manager_cli import auth_accounts as auth_module
@@ -496,3 +497,223 @@ def test_load_current_account_missing_provider(tmp_path: Path) -> None:
     path = tmp_path / "config.toml"
     _write(path, 'default_model = "missing"\n')
     assert auth_module.load_current_account(path) is None
+
+
+def test_parse_toml_reuses_cached_result_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "alpha.toml"
+    _write(path, 'key = "one"\n')
+    first = auth_module._parse_toml(path)
+    assert auth_module._parse_toml(path) is first
+    _write(path, 'key = "second"\n')
+    assert auth_module._parse_toml(path) == {"key": "second"}
+
+
+def test_load_accounts_from_auths_dir_uses_manifest(tmp_path: Path, monkeypatch) -> None:
+    auths_dir = tmp_path / "auths"
+    auths_dir.mkdir()
+    env_path = auths_dir / "alpha.env"
+    _write(env_path, "KMI_API_KEY=sk-alpha\n")
+    manifest = auth_module.accounts_manifest_path(tmp_path / "state")
+
+    first = load_accounts_from_auths_dir(
+        auths_dir, "https://example.com", manifest_path=manifest
+    )
+    assert [account.api_key for account in first] == ["sk-alpha"]
+    assert manifest.exists()
+    if os.name != "nt":
+        assert manifest.stat().st_mode & 0o777 == 0o600
+        assert manifest.parent.stat().st_mode & 0o777 == 0o700
+
+    def fail_parse(*_args, **_kwargs):
+        raise AssertionError("auth file should not be parsed on manifest hit")
+
+    monkeypatch.setattr(auth_module, "_account_from_env", fail_parse)
+    monkeypatch.setattr(auth_module, "_loaded_accounts", {})
+    cached = load_accounts_from_auths_dir(
+        auths_dir, "https://example.com", manifest_path=manifest
+    )
+    assert cached == first
+
+    monkeypatch.undo()
+    _write(env_path, "KMI_API_KEY=sk-alpha-rotated\n")
+    refreshed = load_accounts_from_auths_dir(
+        auths_dir, "https://example.com", manifest_path=manifest
+    )
+    assert [account.api_key for account in refreshed] == ["sk-alpha-rotated"]
+
+
+def test_collect_auth_files_refreshes_when_directory_changes(tmp_path: Path) -> None:
+    auths_dir = tmp_path / "auths"
+    auths_dir.mkdir()
+    _write(auths_dir / "alpha.env", "KMI_API_KEY=sk-alpha\n")
+    assert auth_module.collect_auth_files(auths_dir) == [auths_dir / "alpha.env"]
+
+    _write(auths_dir / "bravo.env", "KMI_API_KEY=sk-bravo\n")
+    stat = auths_dir.stat()
+    os.utime(auths_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert auth_module.collect_auth_files(auths_dir) == [
+        auths_dir / "alpha.env",
+        auths_dir / "bravo.env",
+    ]
+
+
+def test_read_env_values_handles_quotes_comments_and_export(tmp_path: Path) -> None:
+    path = tmp_path / "alpha.env"
+    _write(
+        path,
+        "\n".join(
+            [
+                "# comment",
+                "export KMI_API_KEY='sk-alpha'",
+                'KMI_KEY_LABEL="alpha label"',
+                "KMI_EMAIL=alpha@example.com # owner",
+                "NO_VALUE",
+                'KMI_BASE_URL="https://example.com" # prod',
+                'KMI_KEY_PRIORITY="3"#main',
+                'KMI_NOTE="say \\"hi\\""',
+                "KMI_TAG='it\\'s'",
+                "KMI_HASH=a#b",
+                'KMI_BROKEN="sk-x" trailing',
+                "",
+            ]
+        ),
+    )
+    assert auth_module.read_env_values(path) == {
+        "KMI_API_KEY": "sk-alpha",
+        "KMI_KEY_LABEL": "alpha label",
+        "KMI_EMAIL": "alpha@example.com",
+        "KMI_BASE_URL": "https://example.com",
+        "KMI_KEY_PRIORITY": "3",
+        "KMI_NOTE": 'say "hi"',
+        "KMI_TAG": "it's",
+        "KMI_HASH": "a#b",
+    }
+    assert auth_module.read_env_values(tmp_path / "missing.env") == {}
+
+
+def test_extract_email_from_values_returns_first_value_match() -> None:
+    values = {"name": "alpha", "note": "first@example.com", "owner": "second@example.com"}
+    assert auth_module._extract_email_from_values(values) == "first@example.com"
+    assert auth_module._extract_email_from_values({"name": "alpha", "team": ""}) is None
+
+
+def test_extract_email_from_config_walks_nested_tables_in_order() -> None:
+    config = {
+        "name": "alpha",
+        "limits": {"max": 10, "ratio": 0.5},
+        "owner": {"team": ["ignored@example.com"], "contact": "owner@example.com"},
+        "backup": {"contact": "backup@example.com"},
+    }
+    assert auth_module._extract_email_from_config(config) == "backup@example.com"
+    config["backup"] = {"contact": "none"}
+    assert auth_module._extract_email_from_config(config) == "owner@example.com"
+
+
+def test_extract_email_from_config_prefers_table_scalars_over_sub_tables() -> None:
+    config = {"owner": {"contact": "a@example.com"}, "email_note": "b@example.com"}
+    assert auth_module._extract_email_from_config(config) == "b@example.com"
+    config = {"note": "c@example.com", "email": "d@example.com", "sub": {"email": "e@example.com"}}
+    assert auth_module._extract_email_from_config(config) == "d@example.com"
+
+
+def test_copy_account_config_preserves_bytes(tmp_path: Path) -> None:
+    src = tmp_path / "alpha.toml"
+    dest = tmp_path / "config.toml"
+    content = 'name = "Ålpha"\n'.encode("utf-8")
+    src.write_bytes(content)
+    assert auth_module.copy_account_config(str(src), dest) is True
+    assert dest.read_bytes() == content
+    assert not (tmp_path / "config.toml.tmp").exists()
+
+
+def test_load_accounts_from_auths_dir_parallel_keeps_order(tmp_path: Path) -> None:
+    auths_dir = tmp_path / "auths"
+    auths_dir.mkdir()
+    count = auth_module._PARALLEL_PARSE_THRESHOLD + 4
+    for idx in range(count):
+        _write(auths_dir / f"key{idx:02d}.env", f"KMI_API_KEY=sk-{idx:02d}\n")
+    accounts = load_accounts_from_auths_dir(auths_dir, "https://example.com")
+    assert [account.api_key for account in accounts] == [
+        f"sk-{idx:02d}" for idx in range(count)
+    ]
+
+
+def test_account_from_toml_reads_file_once_for_text_email(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "alpha.toml"
+    _write(
+        path,
+        "\n".join(
+            [
+                "# owner: text@example.com",
+                "[providers.kimi-for-coding]",
+                'api_key = "sk-alpha"',
+                'base_url = "https://example.com"',
+            ]
+        )
+        + "\n",
+    )
+    reads: list[Path] = []
+    original = Path.read_bytes
+
+    def counting_read_bytes(self: Path) -> bytes:
+        reads.append(self)
+        return original(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+    account = auth_module._account_from_toml(path, "https://example.com", allowlist=())
+    assert account is not None
+    assert account.email == "text@example.com"
+    assert reads == [path]
+
+
+def test_extract_email_from_text_bounded_pattern() -> None:
+    assert auth_module._extract_email_from_text("a" * 5000 + "@" + "b" * 5000) is None
+    assert auth_module._extract_email_from_text("x" * 80 + "@example.com") == (
+        "x" * 64 + "@example.com"
+    )
+
+
+def test_collect_auth_files_skips_hidden_temp_and_large_files(tmp_path: Path) -> None:
+    auths_dir = tmp_path / "auths"
+    (auths_dir / ".git").mkdir(parents=True)
+    _write(auths_dir / ".git" / "alpha.env", "KMI_API_KEY=sk-hidden\n")
+    _write(auths_dir / "alpha.env", "KMI_API_KEY=sk-alpha\n")
+    _write(auths_dir / ".DS_Store", "junk")
+    _write(auths_dir / "config.toml.tmp", "junk")
+    _write(auths_dir / "alpha.env.swp", "junk")
+    _write(auths_dir / "alpha.env~", "junk")
+    (auths_dir / "huge.toml").write_bytes(b"#" * (auth_module._MAX_AUTH_FILE_BYTES + 1))
+    assert auth_module.collect_auth_files(auths_dir) == [auths_dir / "alpha.env"]
+
+
+def test_normalize_label_strips_config_and_separators() -> None:
+    assert auth_module._normalize_label("alpha__config") == "alpha"
+    assert auth_module._normalize_label("alpha-CONFIG") == "alpha"
+    assert auth_module._normalize_label("alpha-config-") == "alpha-config"
+    assert auth_module._normalize_label("alpha_") == "alpha"
+    assert auth_module._normalize_label("config") == "config"
+
+
+def test_load_accounts_from_auths_dir_memoised_in_process(tmp_path: Path, monkeypatch) -> None:
+    auths_dir = tmp_path / "auths"
+    auths_dir.mkdir()
+    env_path = auths_dir / "alpha.env"
+    _write(env_path, "KMI_API_KEY=sk-alpha\n")
+    first = load_accounts_from_auths_dir(auths_dir, "https://example.com")
+
+    def fail_read(*_args, **_kwargs):
+        raise AssertionError("manifest/auth files should not be read again")
+
+    monkeypatch.setattr(auth_module, "_read_manifest", fail_read)
+    monkeypatch.setattr(auth_module, "_account_from_env", fail_read)
+    again = load_accounts_from_auths_dir(
+        auths_dir, "https://example.com", manifest_path=tmp_path / "m.json"
+    )
+    assert again == first
+    again.clear()
+    assert load_accounts_from_auths_dir(auths_dir, "https://example.com") == first
+
+    monkeypatch.undo()
+    _write(env_path, "KMI_API_KEY=sk-alpha-two\n")
+    refreshed = load_accounts_from_auths_dir(auths_dir, "https://example.com")
+    assert [account.api_key for account in refreshed] == ["sk-alpha-two"]
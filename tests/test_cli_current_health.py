@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from kmi_manager_cli import cli as cli_module
+from kmi_manager_cli.cli import app
+
+
+runner = CliRunner()
+
+
+def _provider_toml(api_key: str) -> str:
+    return (
+        "\n".join(
+            [
+                "[providers.kimi-for-coding]",
+                f'api_key = "{api_key}"',
+                'base_url = "https://example.com"',
+            ]
+        )
+        + "\n"
+    )
+
+
+def _setup(tmp_path: Path, monkeypatch, current_key: str) -> list:
+    auths_dir = tmp_path / "auths"
+    auths_dir.mkdir()
+    (auths_dir / "alpha.toml").write_text(_provider_toml("sk-shared"), encoding="utf-8")
+    (auths_dir / "bravo.toml").write_text(_provider_toml("sk-shared"), encoding="utf-8")
+    (auths_dir / "charlie.toml").write_text(
+        _provider_toml("sk-other"), encoding="utf-8"
+    )
+    current = tmp_path / "kimi" / "config.toml"
+    current.parent.mkdir()
+    current.write_text(
+        'default_model = "k2"\n\n[models.k2]\nprovider = "kimi-for-coding"\n\n'
+        + _provider_toml(current_key),
+        encoding="utf-8",
+    )
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "\n".join(
+            [
+                "KMI_UPSTREAM_BASE_URL=https://example.com",
+                f"KMI_AUTHS_DIR={auths_dir}",
+                f"KMI_STATE_DIR={tmp_path}",
+            ]
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("KMI_ENV_PATH", str(env_file))
+    monkeypatch.setattr(cli_module, "_current_config_path", lambda: current)
+    rendered: list = []
+    monkeypatch.setattr(
+        "kmi_manager_cli.ui.render_accounts_health_dashboard",
+        lambda accounts, *_a, **_k: rendered.extend(accounts),
+    )
+    return rendered
+
+
+def test_current_health_maps_first_matching_auth_label(
+    tmp_path: Path, monkeypatch
+) -> None:
+    rendered = _setup(tmp_path, monkeypatch, "sk-shared")
+    result = runner.invoke(app, ["--current"])
+    assert result.exit_code == 0
+    assert [account.label for account in rendered] == ["current:alpha"]
+
+
+def test_current_health_keeps_provider_label_without_match(
+    tmp_path: Path, monkeypatch
+) -> None:
+    rendered = _setup(tmp_path, monkeypatch, "sk-unknown")
+    monkeypatch.setattr(
+        cli_module,
+        "load_accounts_from_auths_dir",
+        lambda *_a, **_k: (_ for _ in ()).throw(AssertionError("called")),
+    )
+    result = runner.invoke(app, ["--current"])
+    assert result.exit_code == 0
+    assert [account.label for account in rendered] == ["current:kimi-for-coding"]
+
+
+def test_current_config_path_resolved_once(monkeypatch, tmp_path) -> None:
+    calls = []
+
+    def fake_home():
+        calls.append(1)
+        return tmp_path
+
+    cli_module._current_config_path.cache_clear()
+    monkeypatch.setattr(cli_module.Path, "home", staticmethod(fake_home))
+    try:
+        assert cli_module._current_config_path() == tmp_path / ".kimi" / "config.toml"
+        assert cli_module._current_config_path() == tmp_path / ".kimi" / "config.toml"
+        assert calls == [1]
+    finally:
+        cli_module._current_config_path.cache_clear()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+
+import httpx
+
+from kmi_manager_cli import cli as cli_module
+from kmi_manager_cli.keys import KeyRecord, Registry
+from kmi_manager_cli.trace import compute_confidence, trace_path
+
+
+def test_send_batch_counts_failures() -> None:
+    statuses = iter([200, 500, 204, 404])
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses))
+
+    async def run() -> int:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            request = client.build_request("GET", "http://proxy/models")
+            return await cli_module._send_batch(client, request, 4)
+
+    assert asyncio.run(run()) == 2
+
+
+def _run_e2e(monkeypatch, config, labels, listening=None, **overrides):
+    labels = iter(labels)
+    trace_file = trace_path(config)
+    seen_headers: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("Authorization", ""))
+        entries = [
+            {"endpoint": "/other", "key_label": "z"},
+            {"endpoint": "/models", "key_label": next(labels)},
+        ]
+        with trace_file.open("a", encoding="utf-8") as handle:
+            handle.writelines(json.dumps(entry) + "\n" for entry in entries)
+        return httpx.Response(200)
+
+    real_client = httpx.AsyncClient
+
+    def fake_client(**kwargs):
+        return real_client(**{**kwargs, "transport": httpx.MockTransport(handler)})
+
+    registry = Registry(
+        keys=[
+            KeyRecord(label="a", api_key="sk-a"),
+            KeyRecord(label="b", api_key="sk-b"),
+        ]
+    )
+    monkeypatch.setattr(httpx, "AsyncClient", fake_client)
+    monkeypatch.setattr(
+        cli_module, "proxy_listening", listening or (lambda *_a, **_k: True)
+    )
+    monkeypatch.setattr(cli_module, "_load_registry_or_exit", lambda _config: registry)
+
+    options = {
+        "requests": 4,
+        "batch": 2,
+        "window": 4,
+        "endpoint": "models",
+        "min_confidence": 95.0,
+        "timeout": 1.0,
+        "pause": 0,
+        "scheme": "http",
+        "show_mode": False,
+        "enable_auto_rotate": False,
+    }
+    options.update(overrides)
+    return cli_module._run_e2e(config, **options), seen_headers
+
+
+def test_run_e2e_reports_distribution(monkeypatch, make_config, capsys) -> None:
+    config = make_config(proxy_token="tok")
+    confidence, seen_headers = _run_e2e(monkeypatch, config, ["a", "b"] * 2)
+    out = capsys.readouterr().out
+    assert confidence == 100.0
+    assert seen_headers == ["Bearer tok"] * 4
+    assert "Distribution (last 4): a:2, b:2" in out
+    assert "E2E OK" in out
+
+
+def test_run_e2e_window_drops_oldest_entries(monkeypatch, make_config, capsys) -> None:
+    confidence, _ = _run_e2e(
+        monkeypatch,
+        make_config(),
+        ["a", "a", "b", "b"],
+        window=3,
+        min_confidence=101.0,
+    )
+    out = capsys.readouterr().out
+    assert "sent=2/4 trace=2 keys=1/2 confidence=100.0%" in out
+    assert "sent=4/4 trace=4 keys=2/2" in out
+    assert "Distribution (last 3): a:1, b:2" in out
+    assert confidence == compute_confidence(
+        [{"key_label": "a"}, {"key_label": "b"}, {"key_label": "b"}]
+    )
+
+
+def test_start_proxy_thread_serves_until_stopped(make_config) -> None:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    config = make_config(proxy_listen=f"127.0.0.1:{port}")
+    registry = Registry(keys=[KeyRecord(label="a", api_key="sk-a")])
+
+    stop = cli_module._start_proxy_thread(config, registry)
+    try:
+        assert cli_module._wait_for_port_listen("127.0.0.1", port, timeout=5.0)
+    finally:
+        stop()
+    assert cli_module._wait_for_port_release("127.0.0.1", port, timeout=1.0)
+
+
+def test_run_e2e_throttles_progress_lines(monkeypatch, make_config, capsys) -> None:
+    monkeypatch.setattr(cli_module, "_E2E_PROGRESS_INTERVAL_SECONDS", 3600.0)
+    _run_e2e(
+        monkeypatch,
+        make_config(),
+        ["a", "b"] * 3,
+        requests=6,
+        window=6,
+        min_confidence=101.0,
+    )
+    progress = [
+        line
+        for line in capsys.readouterr().out.splitlines()
+        if line.startswith("sent=")
+    ]
+    assert [line.split()[0] for line in progress] == ["sent=2/6", "sent=6/6"]
+
+
+def test_run_e2e_spawn_proxy_launches_kmi_proxy(
+    monkeypatch, make_config, capsys
+) -> None:
+    spawned: list[list[str]] = []
+
+    class FakeProc:
+        def __init__(self, args, **_kwargs):
+            spawned.append(args)
+
+        def terminate(self) -> None:
+            pass
+
+        def wait(self, timeout=None) -> int:
+            return 0
+
+    def no_thread(*_args):
+        raise AssertionError("in-process proxy should not start with --spawn-proxy")
+
+    monkeypatch.setattr(cli_module.subprocess, "Popen", FakeProc)
+    monkeypatch.setattr(cli_module, "_start_proxy_thread", no_thread)
+    monkeypatch.setattr(cli_module, "_wait_for_port_listen", lambda *_a, **_k: True)
+    confidence, _ = _run_e2e(
+        monkeypatch,
+        make_config(),
+        ["a", "b"] * 2,
+        listening=lambda *_a, **_k: bool(spawned),
+        spawn_proxy=True,
+    )
+    assert spawned == [["kmi", "proxy"]]
+    assert confidence == 100.0
+    assert "Proxy is not running; starting it now..." in capsys.readouterr().out
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typer.testing import CliRunner
 
-from kmi_manager_cli.cli import app
+from kmi_manager_cli.cli import app, rotate_app
 
 
 runner = CliRunner()
@@ -15,3 +15,19 @@ def test_cli_help_includes_required_flags() -> None:
         assert flag in result.stdout
     assert "Version:" in result.stdout
     assert "Config file: .env" in result.stdout
+
+
+def test_cli_registers_each_command_once() -> None:
+    for typer_app in (app, rotate_app):
+        names = [
+            command.name or command.callback.__name__.replace("_", "-")
+            for command in typer_app.registered_commands
+        ]
+        assert len(names) == len(set(names))
+    assert [group.name for group in app.registered_groups] == ["rotate"]
+
+
+def test_cli_rejects_multiple_modes() -> None:
+    result = runner.invoke(app, ["--health", "--status"])
+    assert result.exit_code == 2
+    assert "Choose only one mode" in result.output
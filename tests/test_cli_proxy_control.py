@@ -1,7 +1,19 @@
 from __future__ import annotations
 
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import typer
 from typer.testing import CliRunner
 
+from kmi_manager_cli import cli as cli_module
 from kmi_manager_cli.cli import app
 from kmi_manager_cli.keys import KeyRecord, Registry
 from kmi_manager_cli.state import State
@@ -101,22 +113,22 @@ def test_proxy_auto_stops_existing_listener(monkeypatch, tmp_path) -> None:
 
     state = {"count": 0}
 
-    def fake_listening(_host: str, _port: int) -> bool:
+    def fake_listening(_host: str, _port: int, **_kwargs) -> bool:
         state["count"] += 1
         return state["count"] == 1
 
     def fake_find(_port: int):
         return [4321]
 
-    def fake_terminate(_pids, force=False):
+    def fake_terminate(_pids, force=False, daemon_pid=None):
         calls["terminate"] += 1
 
     monkeypatch.setattr("kmi_manager_cli.cli.proxy_listening", fake_listening)
     monkeypatch.setattr("kmi_manager_cli.cli._find_listening_pids", fake_find)
     monkeypatch.setattr("kmi_manager_cli.cli._terminate_pids", fake_terminate)
-    monkeypatch.setattr("kmi_manager_cli.cli.run_proxy", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("kmi_manager_cli.proxy.run_proxy", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(
-        "kmi_manager_cli.cli._load_registry_or_exit",
+        "kmi_manager_cli.cli._load_registry",
         lambda _config: Registry(keys=[KeyRecord(label="alpha", api_key="sk")]),
     )
     monkeypatch.setattr("kmi_manager_cli.cli.load_state", lambda _config, _registry: State())
@@ -124,3 +136,180 @@ def test_proxy_auto_stops_existing_listener(monkeypatch, tmp_path) -> None:
     result = runner.invoke(app, ["proxy", "--foreground"])
     assert result.exit_code == 0
     assert calls["terminate"] >= 1
+
+
+def test_find_listening_pids_cached_until_terminate(monkeypatch) -> None:
+    calls = []
+
+    def fake_lsof(port: int):
+        calls.append(port)
+        return [42]
+
+    monkeypatch.setattr(cli_module, "_pid_cache", {})
+    monkeypatch.setattr(cli_module, "_proc_listening_pids", lambda _port: None)
+    monkeypatch.setattr(cli_module, "_lsof_listening_pids", fake_lsof)
+    monkeypatch.setattr(cli_module, "_shared_process_group", lambda _pids: None)
+    monkeypatch.setattr(cli_module.os, "kill", lambda *_a: None)
+
+    assert cli_module._find_listening_pids(4321) == [42]
+    assert cli_module._find_listening_pids(4321) == [42]
+    assert calls == [4321]
+
+    cli_module._terminate_pids([42], force=False)
+    assert cli_module._find_listening_pids(4321) == [42]
+    assert calls == [4321, 4321]
+
+
+def test_proc_listening_pids_finds_own_socket() -> None:
+    if not sys.platform.startswith("linux"):
+        pytest.skip("/proc/net/tcp is Linux-only")
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+        assert cli_module._proc_listening_pids(port) == [os.getpid()]
+    assert cli_module._proc_listening_pids(port) == []
+
+
+def test_terminate_pids_signals_daemon_process_group() -> None:
+    if not hasattr(os, "killpg"):
+        pytest.skip("process groups are POSIX-only")
+    assert cli_module._shared_process_group([os.getpid()]) is None
+    child = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(30)"],
+        start_new_session=True,
+    )
+    try:
+        assert cli_module._shared_process_group([child.pid]) == child.pid
+        cli_module._terminate_pids([child.pid], force=False, daemon_pid=child.pid)
+        assert child.wait(timeout=5) != 0
+    finally:
+        if child.poll() is None:
+            child.kill()
+            child.wait()
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    stat_path = Path(f"/proc/{pid}/stat")
+    if stat_path.exists():
+        # A killed but unreaped process still answers signal 0.
+        return stat_path.read_text().rsplit(")", 1)[1].split()[0] != "Z"
+    return True
+
+
+def test_terminate_pids_spares_group_of_foreign_listener() -> None:
+    if not hasattr(os, "killpg"):
+        pytest.skip("process groups are POSIX-only")
+    script = (
+        "import subprocess, sys, time\n"
+        "p = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+        "print(p.pid, flush=True)\n"
+        "time.sleep(30)\n"
+    )
+    leader = subprocess.Popen(
+        [sys.executable, "-c", script],
+        stdout=subprocess.PIPE,
+        text=True,
+        start_new_session=True,
+    )
+    sibling = int(leader.stdout.readline())
+    try:
+        assert cli_module._shared_process_group([leader.pid]) == leader.pid
+        cli_module._terminate_pids([leader.pid], force=False, daemon_pid=None)
+        assert leader.wait(timeout=5) != 0
+        assert _process_alive(sibling)
+    finally:
+        if leader.poll() is None:
+            leader.kill()
+            leader.wait()
+        leader.stdout.close()
+        try:
+            os.kill(sibling, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+def test_wait_for_port_release_backs_off(monkeypatch) -> None:
+    answers = iter([True, True, False])
+    sleeps: list[float] = []
+    monkeypatch.setattr(cli_module, "proxy_listening", lambda *_a, **_k: next(answers))
+    monkeypatch.setattr(cli_module.time, "sleep", sleeps.append)
+    assert cli_module._wait_for_port_release("127.0.0.1", 1) is True
+    assert sleeps == [0.02, 0.04]
+
+
+def test_proxy_port_failure_reported_before_registry_error(
+    monkeypatch, make_config, capsys
+) -> None:
+    def port_busy(_config, echo):
+        echo("port busy")
+        raise typer.Exit(code=3)
+
+    monkeypatch.setattr(cli_module, "_ensure_proxy_port_free", port_busy)
+    monkeypatch.setattr(cli_module, "_load_registry", lambda _config: Registry(keys=[]))
+    monkeypatch.setattr(cli_module, "no_keys_message", lambda _config: "no keys")
+    with pytest.raises(typer.Exit) as excinfo:
+        cli_module._free_port_and_load_registry(make_config())
+    assert excinfo.value.exit_code == 3
+    assert capsys.readouterr().out == "port busy\n"
+
+    main_thread = threading.current_thread()
+    echoed_from: list[threading.Thread] = []
+
+    def port_free(_config, echo):
+        echoed_from.append(threading.current_thread())
+        echo("checked")
+        echo("free")
+
+    monkeypatch.setattr(cli_module, "_ensure_proxy_port_free", port_free)
+    with pytest.raises(typer.Exit):
+        cli_module._free_port_and_load_registry(make_config())
+    assert capsys.readouterr().out == "checked\nfree\nno keys\n"
+    assert echoed_from and echoed_from[0] is not main_thread
+
+    registry = Registry(keys=[KeyRecord(label="alpha", api_key="sk")])
+    monkeypatch.setattr(cli_module, "_load_registry", lambda _config: registry)
+    assert cli_module._free_port_and_load_registry(make_config()) is registry
+
+
+def test_lsof_listening_pids_parses_binary_output(monkeypatch) -> None:
+    captured = {}
+
+    def fake_run(args, **kwargs):
+        captured["kwargs"] = kwargs
+        return SimpleNamespace(stdout=b"4321\n99\n\nbad\n4321\n")
+
+    monkeypatch.setattr(cli_module.shutil, "which", lambda _name: "/usr/bin/lsof")
+    monkeypatch.setattr(cli_module.subprocess, "run", fake_run)
+    assert cli_module._lsof_listening_pids(9999) == [99, 4321]
+    assert "text" not in captured["kwargs"]
+    assert captured["kwargs"]["close_fds"] is False
+
+
+def test_wait_for_port_listen_backs_off_with_cap(monkeypatch) -> None:
+    answers = iter([False] * 7 + [True])
+    sleeps: list[float] = []
+    monkeypatch.setattr(cli_module, "proxy_listening", lambda *_a, **_k: next(answers))
+    monkeypatch.setattr(cli_module.time, "sleep", sleeps.append)
+    assert cli_module._wait_for_port_listen("127.0.0.1", 1) is True
+    assert sleeps == [0.01, 0.02, 0.04, 0.08, 0.16, 0.2, 0.2]
+
+
+def test_ensure_proxy_port_free_passes_recorded_daemon_pid(monkeypatch, make_config) -> None:
+    config = make_config()
+    cli_module.proxy_pid_path(config).write_text("4321\n", encoding="utf-8")
+    calls = []
+    answers = iter([True, False])
+    monkeypatch.setattr(cli_module, "proxy_listening", lambda *_a, **_k: next(answers))
+    monkeypatch.setattr(cli_module, "_find_listening_pids", lambda _port: [4321])
+    monkeypatch.setattr(
+        cli_module,
+        "_terminate_pids",
+        lambda pids, force, daemon_pid=None: calls.append((pids, force, daemon_pid)),
+    )
+    cli_module._ensure_proxy_port_free(config)
+    assert calls == [([4321], False, 4321)]
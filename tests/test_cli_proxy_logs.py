@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from typer.testing import CliRunner
 
+from kmi_manager_cli import cli as cli_module
 from kmi_manager_cli.cli import app
 
 
@@ -72,3 +74,81 @@ def test_proxy_logs_since_app_json(tmp_path: Path, monkeypatch) -> None:
     assert result.exit_code == 0
     assert "new" in result.stdout
     assert "old" not in result.stdout
+
+
+def test_proxy_logs_piped_output_strips_ansi(tmp_path: Path, monkeypatch) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "\n".join(
+            [
+                "KMI_PROXY_LISTEN=127.0.0.1:9999",
+                "KMI_AUTHS_DIR=/tmp",
+                f"KMI_STATE_DIR={tmp_path}",
+            ]
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("KMI_ENV_PATH", str(env_file))
+
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    (log_dir / "proxy.out").write_text(
+        "plain\n\x1b[32mINFO\x1b[0m: started\n", encoding="utf-8"
+    )
+
+    result = runner.invoke(app, ["proxy-logs", "--no-follow"])
+    assert result.exit_code == 0
+    assert result.stdout == "plain\nINFO: started\n"
+
+
+def test_read_tail_lines_across_blocks(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(cli_module, "_TAIL_BLOCK_SIZE", 4)
+    path = tmp_path / "app.log"
+    path.write_bytes(b"first\nsecond\n\nfourth\nfifth")
+    assert cli_module._read_tail_lines(path, 3) == ["", "fourth", "fifth"]
+    assert cli_module._read_tail_lines(path, 10) == ["first", "second", "", "fourth", "fifth"]
+
+    path.write_bytes(b"one\ntwo\n")
+    assert cli_module._read_tail_lines(path, 1) == ["two"]
+    path.write_bytes(b"")
+    assert cli_module._read_tail_lines(path, 5) == []
+
+
+def test_read_tail_lines_mmap_matches_block_read(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "app.log"
+    path.write_bytes(b"first\nsecond\n\nfourth\nfifth\n")
+    expected = cli_module._read_tail_lines(path, 3)
+    monkeypatch.setattr(cli_module, "_MMAP_TAIL_THRESHOLD", 0)
+    assert cli_module._read_tail_lines(path, 3) == expected == ["", "fourth", "fifth"]
+    assert cli_module._read_tail_lines(path, 9) == ["first", "second", "", "fourth", "fifth"]
+    path.write_bytes(b"")
+    assert cli_module._read_tail_lines(path, 2) == []
+
+
+def test_filter_lines_since_compares_offsets_without_json() -> None:
+    since = datetime(2026, 2, 2, 12, 0, 0, 500000, tzinfo=timezone.utc)
+    lines = [
+        '{"ts":"2026-02-02 12:00:00 +0000","message":"same-second"}',
+        '{"ts":"2026-02-02 12:00:01 +0000","message":"after"}',
+        '{"ts":"2026-02-02 14:59:59 +0300","message":"before-offset"}',
+        '{"ts":"2026-02-02 15:00:01 +0300","message":"after-offset"}',
+        '{"level":"INFO","ts":"2026-02-02T12:00:05Z","message":"fallback"}',
+        "not json",
+    ]
+    kept = cli_module._filter_lines_since(lines, since, json_lines=True)
+    assert kept == [lines[1], lines[3], lines[4]]
+
+
+def test_parse_since_relative_units() -> None:
+    now = datetime.now(timezone.utc)
+    for raw, seconds in (("30s", 30), ("10m", 600), ("2H", 7200), ("1d", 86400)):
+        parsed = cli_module._parse_since(raw)
+        assert parsed is not None
+        assert abs((now - parsed) - timedelta(seconds=seconds)) < timedelta(seconds=5)
+    assert cli_module._parse_since("m") is None
+    assert cli_module._parse_since("10w") is None
+    assert cli_module._parse_since("２m") is None
+    assert cli_module._parse_since("2026-02-02T12:00:00Z") == datetime(
+        2026, 2, 2, 12, tzinfo=timezone.utc
+    )
@@ -2,9 +2,14 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+import typer
 from typer.testing import CliRunner
 
+from kmi_manager_cli import cli as cli_module
 from kmi_manager_cli.cli import app
+from kmi_manager_cli.keys import KeyRecord, Registry
+from kmi_manager_cli.state import State, save_state
 
 
 def _write_auth(path: Path, label: str, key: str) -> None:
@@ -41,3 +46,36 @@ def test_cli_rotate_advances_on_tie_in_dry_run(tmp_path: Path, monkeypatch) -> N
     assert result.exit_code == 0
     assert "Rotation complete" in result.stdout
     assert "Active key:" in result.stdout
+
+
+def test_active_key_clamps_index() -> None:
+    registry = Registry(
+        keys=[
+            KeyRecord(label="a", api_key="sk-a"),
+            KeyRecord(label="b", api_key="sk-b"),
+        ]
+    )
+    assert cli_module._active_key(registry, State(active_index=1)) == (1, "b")
+    assert cli_module._active_key(registry, State(active_index=5)) == (1, "b")
+    assert cli_module._active_key(registry, State(active_index=-2)) == (0, "a")
+    assert cli_module._active_key(Registry(keys=[]), State(active_index=3)) == (
+        0,
+        "none",
+    )
+
+
+def test_load_context_reads_fresh_state(tmp_path: Path, make_config) -> None:
+    auths_dir = tmp_path / "auths"
+    auths_dir.mkdir()
+    config = make_config(auths_dir=auths_dir, state_dir=tmp_path / "state")
+    registry, state = cli_module._load_context(config, require_keys=False)
+    assert registry.keys == []
+    with pytest.raises(typer.Exit):
+        cli_module._load_context(config)
+
+    _write_auth(auths_dir / "a.env", "a", "sk-a")
+    registry, state = cli_module._load_context(config)
+    assert [key.label for key in registry.keys] == ["a"]
+    state.auto_rotate = True
+    save_state(config, state)
+    assert cli_module._load_context(config)[1].auto_rotate is True
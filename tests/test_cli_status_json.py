@@ -5,7 +5,10 @@ from pathlib import Path
 
 from typer.testing import CliRunner
 
+from kmi_manager_cli import cli as cli_module
 from kmi_manager_cli.cli import app
+from kmi_manager_cli.keys import KeyRecord, Registry
+from kmi_manager_cli.state import KeyState, State
 
 
 runner = CliRunner()
@@ -41,3 +44,66 @@ def test_status_json_output(tmp_path: Path, monkeypatch) -> None:
     assert payload["keys"]["total"] == 1
     assert payload["active_key"] == "alpha"
     assert "last_health_refresh" in payload
+
+
+def test_status_panels_reuse_labels(tmp_path: Path, monkeypatch) -> None:
+    auths_dir = tmp_path / "auths"
+    auths_dir.mkdir()
+    (auths_dir / "alpha.env").write_text(
+        "KMI_API_KEY=sk-test\nKMI_KEY_LABEL=alpha\n",
+        encoding="utf-8",
+    )
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "\n".join(
+            [
+                "KMI_PROXY_LISTEN=127.0.0.1:9999",
+                f"KMI_AUTHS_DIR={auths_dir}",
+                f"KMI_STATE_DIR={tmp_path}",
+            ]
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("KMI_ENV_PATH", str(env_file))
+
+    first = runner.invoke(app, ["status"])
+    second = runner.invoke(app, ["status"])
+    assert first.exit_code == 0
+    assert first.stdout == second.stdout
+    assert "Proxy URL: " in first.stdout
+    assert "Active key: alpha" in first.stdout
+    assert cli_module._status_labels() is cli_module._status_labels()
+    assert cli_module._status_labels()["upstream"].plain == "🌐 Upstream: "
+
+
+def test_echo_json_matches_stdlib_output(monkeypatch, capsys) -> None:
+    payload = {"proxy": {"running": False, "pids": None}, "keys": {}, "ratio": 1.5}
+    cli_module._echo_json({"label": "ключ"})
+    assert "\\u043a" in capsys.readouterr().out
+
+    cli_module._echo_json(payload)
+    fast = capsys.readouterr().out
+    monkeypatch.setattr(cli_module, "orjson", None)
+    cli_module._echo_json(payload)
+    assert capsys.readouterr().out == fast == json.dumps(payload, indent=2) + "\n"
+
+
+def test_build_status_payload_counts_keys(make_config, monkeypatch) -> None:
+    monkeypatch.setattr(cli_module, "proxy_listening", lambda *_a, **_k: False)
+    registry = Registry(
+        keys=[
+            KeyRecord(label="a", api_key="sk-a", disabled=True),
+            KeyRecord(label="b", api_key="sk-b"),
+            KeyRecord(label="c", api_key="sk-c"),
+        ]
+    )
+    state = State(
+        keys={
+            "a": KeyState(blocked_reason="payment_required"),
+            "b": KeyState(exhausted_until="2999-01-01T00:00:00Z"),
+            "c": KeyState(exhausted_until="2000-01-01T00:00:00Z"),
+        }
+    )
+    payload = cli_module._build_status_payload(make_config(), registry, state)
+    assert payload["keys"] == {"total": 3, "disabled": 1, "blocked": 1, "exhausted": 1}
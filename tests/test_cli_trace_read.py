@@ -3,7 +3,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from kmi_manager_cli.cli import _read_new_trace_entries
+from kmi_manager_cli import cli as cli_module
+from kmi_manager_cli.cli import _read_new_trace_entries, _TraceTail
 
 
 def test_read_new_trace_entries_handles_partial_line(tmp_path: Path) -> None:
@@ -37,3 +38,79 @@ def test_read_new_trace_entries_resets_on_truncate(tmp_path: Path) -> None:
     entries, offset = _read_new_trace_entries(path, offset)
     assert entries == [{"c": 3}]
     assert offset == path.stat().st_size
+
+
+def test_read_new_trace_entries_skips_bad_lines(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "trace.jsonl"
+    path.write_bytes(b'{"a": 1}\r\n\nnot json\n\xff\xfe\n{"b": "\xc3\xa9"}\n')
+
+    fast, offset = _read_new_trace_entries(path, 0)
+    monkeypatch.setattr(cli_module, "orjson", None)
+    slow, _ = _read_new_trace_entries(path, 0)
+    assert fast == slow == [{"a": 1}, {"b": "é"}]
+    assert offset == path.stat().st_size
+
+
+def test_trace_tail_keeps_fd_and_follows_rotation(tmp_path: Path) -> None:
+    path = tmp_path / "trace.jsonl"
+    tail = _TraceTail(path)
+    try:
+        assert tail.read() == []
+        path.write_text('{"a": 1}\n{"b"', encoding="utf-8")
+        assert tail.read() == [{"a": 1}]
+        fd = tail._fd
+
+        with path.open("a", encoding="utf-8") as out:
+            out.write(": 2}\n")
+        assert tail.read() == [{"b": 2}]
+        assert tail._fd == fd
+        assert tail.offset == path.stat().st_size
+
+        path.replace(tmp_path / "trace.jsonl.1")
+        path.write_text('{"c": 3}\n', encoding="utf-8")
+        assert tail.read() == [{"c": 3}]
+        assert tail.offset == path.stat().st_size
+    finally:
+        tail.close()
+
+
+def test_trace_tail_needle_skips_other_lines(tmp_path: Path) -> None:
+    path = tmp_path / "trace.jsonl"
+    lines = [
+        {"endpoint": "/models", "key_label": "a"},
+        {"endpoint": "/chat", "key_label": "b"},
+        {"key_label": "c", "endpoint": "/models"},
+    ]
+    path.write_text(
+        "".join(json.dumps(line, separators=(",", ":")) + "\n" for line in lines),
+        encoding="utf-8",
+    )
+    tail = _TraceTail(path, needle=json.dumps("/models").encode())
+    try:
+        assert [entry["key_label"] for entry in tail.read()] == ["a", "c"]
+        assert tail.offset == path.stat().st_size
+    finally:
+        tail.close()
+
+
+def test_trace_tail_preads_only_appended_bytes(tmp_path: Path, monkeypatch) -> None:
+    reads: list[tuple[int, int]] = []
+    real_pread = cli_module._pread
+
+    def spy(fd: int, size: int, offset: int) -> bytes:
+        reads.append((size, offset))
+        return real_pread(fd, size, offset)
+
+    monkeypatch.setattr(cli_module, "_pread", spy)
+    path = tmp_path / "trace.jsonl"
+    path.write_text('{"a": 1}\n', encoding="utf-8")
+    tail = cli_module._TraceTail(path, offset=0)
+    try:
+        assert tail.read() == [{"a": 1}]
+        assert tail.read() == []
+        with path.open("a", encoding="utf-8") as out:
+            out.write('{"b": 2}\n')
+        assert tail.read() == [{"b": 2}]
+    finally:
+        tail.close()
+    assert reads == [(9, 0), (9, 9)]
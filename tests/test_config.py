@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 
+from kmi_manager_cli import config as config_module
 from kmi_manager_cli.config import (
     DEFAULT_KMI_AUTHS_DIR,
     DEFAULT_KMI_PROXY_BASE_PATH,
@@ -103,3 +105,48 @@ def test_allowlist_wildcard_allows_host(monkeypatch, tmp_path: Path) -> None:
 
     cfg = load_config(env_path=tmp_path / "missing.env")
     assert cfg.upstream_base_url == "https://api.kimi.com/coding/v1"
+
+
+def test_load_config_memoised_until_inputs_change(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(config_module, "_config_cache", {})
+    env_file = tmp_path / ".env"
+    env_file.write_text(f"KMI_PROXY_LISTEN=127.0.0.1:9001\nKMI_AUTHS_DIR={tmp_path}\n")
+    monkeypatch.setenv("KMI_PROXY_LISTEN", "127.0.0.1:1")
+    monkeypatch.setenv("KMI_AUTHS_DIR", str(tmp_path))
+
+    first = load_config(env_path=env_file)
+    assert first.proxy_listen == "127.0.0.1:9001"
+    assert load_config(env_path=env_file) is first
+
+    monkeypatch.setenv("KMI_DRY_RUN", "0")
+    assert load_config(env_path=env_file).dry_run is False
+
+    env_file.write_text(f"KMI_PROXY_LISTEN=127.0.0.1:9002\nKMI_AUTHS_DIR={tmp_path}\n")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config(env_path=env_file).proxy_listen == "127.0.0.1:9002"
+
+
+def test_load_config_refreshes_default_auths_dir(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(config_module, "_config_cache", {})
+    monkeypatch.delenv("KMI_AUTHS_DIR", raising=False)
+    monkeypatch.delenv("KMI_ENV_PATH", raising=False)
+    monkeypatch.setattr(config_module, "_PROJECT_ENV_PATH", tmp_path / "missing.env")
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+    home = tmp_path / "home"
+    monkeypatch.setenv("HOME", str(home))
+
+    assert load_config().auths_dir == Path("_auths")
+    home_auths = home / ".kimi" / "_auths"
+    home_auths.mkdir(parents=True)
+    assert load_config().auths_dir == home_auths
+
+    other_home = tmp_path / "other"
+    (other_home / ".kimi" / "_auths").mkdir(parents=True)
+    monkeypatch.setenv("HOME", str(other_home))
+    assert load_config().auths_dir == other_home / ".kimi" / "_auths"
+
+    (workdir / "_auths").mkdir()
+    assert load_config().auths_dir == Path("_auths")
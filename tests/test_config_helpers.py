@@ -48,6 +48,27 @@ def test_resolve_env_path_falls_back_to_dotenv(monkeypatch, tmp_path: Path) -> N
     assert resolved == Path(".env")
 
 
+def test_resolve_env_path_finds_project_root_env(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.delenv("KMI_ENV_PATH", raising=False)
+    cwd = tmp_path / "elsewhere"
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+    project_env = tmp_path / "project" / ".env"
+    monkeypatch.setattr(config_module, "_PROJECT_ENV_PATH", project_env)
+    assert config_module._resolve_env_path() is None
+
+    project_env.parent.mkdir()
+    project_env.write_text("KMI_PROXY_LISTEN=127.0.0.1:1\n", encoding="utf-8")
+    assert config_module._resolve_env_path() == project_env
+
+    (cwd / ".env").write_text("KMI_PROXY_LISTEN=127.0.0.1:2\n", encoding="utf-8")
+    assert config_module._resolve_env_path() == Path(".env")
+
+
+def test_project_env_path_is_repo_root() -> None:
+    assert config_module._PROJECT_ENV_PATH.parent == Path(__file__).resolve().parents[1]
+
+
 def test_resolve_auths_dir_prefers_env(monkeypatch, tmp_path: Path) -> None:
     env_dir = tmp_path / "auths"
     env_dir.mkdir()
@@ -94,7 +115,7 @@ def test_resolve_auths_dir_falls_back_to_default_when_missing(monkeypatch) -> No
     assert config_module._resolve_auths_dir() == default_path
 
 
-def test_load_config_calls_load_dotenv_without_env_path(monkeypatch, tmp_path: Path) -> None:
+def test_load_config_skips_load_dotenv_without_env_path(monkeypatch, tmp_path: Path) -> None:
     calls = {}
 
     monkeypatch.delenv("KMI_ENV_PATH", raising=False)
@@ -106,6 +127,18 @@ def test_load_config_calls_load_dotenv_without_env_path(monkeypatch, tmp_path: P
         calls["override"] = override
 
     monkeypatch.setattr(config_module, "load_dotenv", fake_load_dotenv)
+    monkeypatch.setattr(config_module, "_config_cache", {})
 
     config_module.load_config(env_path=None)
-    assert calls["path"] is None
+    assert calls == {}
+
+
+def test_host_allowed_compiles_allowlist_once() -> None:
+    config_module._compile_allowlist.cache_clear()
+    allowlist = ("API.kimi.com", "*.Moonshot.cn")
+    assert config_module._host_allowed("api.KIMI.com", allowlist) is True
+    assert config_module._host_allowed("eu.moonshot.cn", allowlist) is True
+    assert config_module._host_allowed("moonshot.cn", allowlist) is False
+    assert config_module._host_allowed("evilmoonshot.cn", allowlist) is False
+    info = config_module._compile_allowlist.cache_info()
+    assert (info.misses, info.hits) == (1, 3)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import json
+import os
+import socket
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 
+import pytest
+
 from kmi_manager_cli import doctor as doctor_module
+from kmi_manager_cli import proxy_utils
 from kmi_manager_cli.config import Config
 from kmi_manager_cli.health import Usage
 from kmi_manager_cli.keys import KeyRecord, Registry
@@ -49,15 +55,25 @@ def test_status_badge_default() -> None:
 
 
 def test_proxy_listening_true(monkeypatch) -> None:
-    class DummySocket:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return None
-
-    monkeypatch.setattr(doctor_module.socket, "create_connection", lambda *_a, **_k: DummySocket())
-    assert proxy_listening("127.0.0.1", 1234) is True
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+        monkeypatch.setattr(
+            doctor_module.socket,
+            "getaddrinfo",
+            lambda *_a, **_k: [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))],
+        )
+        assert proxy_listening("localhost", port, force=True) is True
+
+
+def test_proxy_listening_ip_literal_uses_connect_ex() -> None:
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+        assert proxy_listening("127.0.0.1", port, force=True) is True
+    assert proxy_listening("127.0.0.1", port, force=True) is False
 
 
 def test_normalize_connect_host() -> None:
@@ -77,6 +93,27 @@ def test_file_status_ok(tmp_path: Path) -> None:
     assert "updated" in check.details
 
 
+def test_file_status_uses_given_now(tmp_path: Path) -> None:
+    path = tmp_path / "kmi.log"
+    path.write_text("data\n", encoding="utf-8")
+    os.utime(path, (1_000_000, 1_000_000))
+    check = doctor_module._file_status(path, "Log", now=1_000_000 + 7200)
+    assert check.details == "updated 2h ago, 1KB"
+
+
+def test_collect_insecure_skips_missing_paths(tmp_path: Path) -> None:
+    if os.name == "nt":
+        pytest.skip("POSIX permissions only")
+    loose = tmp_path / "loose.env"
+    loose.write_text("x", encoding="utf-8")
+    loose.chmod(0o644)
+    tight = tmp_path / "tight.env"
+    tight.write_text("x", encoding="utf-8")
+    tight.chmod(0o600)
+    paths = [tmp_path / "missing.env", loose, tight]
+    assert doctor_module._collect_insecure(paths) == [str(loose)]
+
+
 def test_check_env(tmp_path: Path) -> None:
     config = _make_config(tmp_path)
     assert doctor_module._check_env(config).status == "info"
@@ -182,6 +219,19 @@ def test_check_state(tmp_path: Path) -> None:
     assert check.status == "info"
 
 
+def test_check_state_without_orjson(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(doctor_module, "orjson", None)
+    config = _make_config(tmp_path)
+    state_path = tmp_path / "state.json"
+    state_path.write_bytes(b"\xff\xfe not json")
+    assert doctor_module._check_state(config).status == "fail"
+
+    state_path.write_text(json.dumps({"auto_rotate": True}), encoding="utf-8")
+    check = doctor_module._check_state(config)
+    assert check.status == "info"
+    assert check.details == "auto_rotate=on"
+
+
 def test_check_permissions(monkeypatch, tmp_path: Path) -> None:
     config = _make_config(tmp_path)
     monkeypatch.setattr(doctor_module, "_collect_insecure", lambda _paths: ["a", "b", "c", "d"])
@@ -190,6 +240,44 @@ def test_check_permissions(monkeypatch, tmp_path: Path) -> None:
     assert "insecure" in check.details
 
 
+def test_check_permissions_reports_auths_dir_then_files(tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    auths_dir = tmp_path / "auths"
+    auths_dir.mkdir()
+    auth_file = auths_dir / "a.env"
+    auth_file.write_text("KMI_API_KEY=sk-a\n", encoding="utf-8")
+    auths_dir.chmod(0o755)
+    auth_file.chmod(0o644)
+    check = doctor_module._check_permissions(config)
+    assert check.status == "warn"
+    assert check.details.startswith(f"insecure: {auths_dir}, {auth_file}")
+
+    auths_dir.chmod(0o700)
+    auth_file.chmod(0o600)
+    tmp_path.chmod(0o700)
+    assert doctor_module._check_permissions(config).status == "ok"
+
+
+def test_check_permissions_reports_loose_account_manifest(tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    tmp_path.chmod(0o700)
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir(mode=0o755)
+    cache_dir.chmod(0o755)
+    manifest = cache_dir / "accounts.json"
+    manifest.write_text("{}", encoding="utf-8")
+    manifest.chmod(0o644)
+    check = doctor_module._check_permissions(config)
+    assert check.status == "warn"
+    assert check.details == f"insecure: {cache_dir}, {manifest}"
+
+    usage_cache = cache_dir / "health.json"
+    usage_cache.write_text("{}", encoding="utf-8")
+    usage_cache.chmod(0o644)
+    check = doctor_module._check_permissions(config)
+    assert check.details == f"insecure: {cache_dir}, {manifest}, {usage_cache}"
+
+
 def test_recheck_blocked_keys(monkeypatch, tmp_path: Path) -> None:
     config = _make_config(tmp_path)
     registry = Registry(keys=[KeyRecord(label="a", api_key="sk-a")])
@@ -219,12 +307,35 @@ def test_recheck_blocked_keys(monkeypatch, tmp_path: Path) -> None:
     assert remaining == 1
 
 
+def test_recheck_blocked_keys_probes_concurrently(monkeypatch, tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    labels = ["a", "b", "c"]
+    registry = Registry(
+        keys=[KeyRecord(label=label, api_key=f"sk-{label}") for label in labels + ["ok"]]
+    )
+    state = State(keys={label: KeyState(blocked_reason="payment_required") for label in labels})
+    barrier = threading.Barrier(len(labels), timeout=5)
+    seen: list[str] = []
+
+    def fake_fetch(*_args, label, **_kwargs):
+        seen.append(label)
+        barrier.wait()
+        return None if label == "b" else Usage(None, None, None, None, None, [], {})
+
+    monkeypatch.setattr(doctor_module, "fetch_usage", fake_fetch)
+    cleared, remaining = doctor_module._recheck_blocked_keys(config, registry, state)
+    assert (cleared, remaining) == (2, 1)
+    assert sorted(seen) == labels
+    assert state.keys["b"].blocked_reason == "payment_required"
+    assert state.keys["a"].blocked_reason is None
+
+
 def test_run_doctor_uses_checks(monkeypatch, tmp_path: Path) -> None:
     config = _make_config(tmp_path)
     monkeypatch.setattr(
         doctor_module,
         "collect_checks",
-        lambda _config: [
+        lambda _config, _registry=None: [
             doctor_module.DoctorCheck("A", "ok", "ok"),
             doctor_module.DoctorCheck("B", "fail", "bad"),
         ],
@@ -243,7 +354,7 @@ def test_run_doctor_clear_blocklist(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(
         doctor_module,
         "collect_checks",
-        lambda _config: [doctor_module.DoctorCheck("A", "ok", "ok", fix="do")],
+        lambda _config, _registry=None: [doctor_module.DoctorCheck("A", "ok", "ok", fix="do")],
     )
     monkeypatch.setattr(
         doctor_module,
@@ -263,7 +374,7 @@ def test_run_doctor_recheck_keys(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(
         doctor_module,
         "collect_checks",
-        lambda _config: [doctor_module.DoctorCheck("A", "ok", "ok")],
+        lambda _config, _registry=None: [doctor_module.DoctorCheck("A", "ok", "ok")],
     )
     monkeypatch.setattr(
         doctor_module,
@@ -276,3 +387,81 @@ def test_run_doctor_recheck_keys(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(doctor_module, "save_state", lambda *_a, **_k: None)
     code = doctor_module.run_doctor(config, recheck_keys=True)
     assert code == 0
+
+
+def test_run_doctor_loads_registry_once(monkeypatch, tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    loads: list[int] = []
+
+    def fake_load(*_a, **_k):
+        loads.append(1)
+        return Registry(keys=[])
+
+    monkeypatch.setattr(
+        doctor_module,
+        "get_console",
+        lambda: SimpleNamespace(print=lambda *args, **kwargs: None),
+    )
+    monkeypatch.setattr(doctor_module, "load_auths_dir", fake_load)
+    monkeypatch.setattr(doctor_module, "load_state", lambda *_a, **_k: State())
+    monkeypatch.setattr(doctor_module, "_recheck_blocked_keys", lambda *_a, **_k: (0, 0))
+    monkeypatch.setattr(doctor_module, "save_state", lambda *_a, **_k: None)
+    doctor_module.run_doctor(config, recheck_keys=True, clear_blocklist=True)
+    assert len(loads) == 1
+
+
+def test_proxy_listening_caches_until_forced(monkeypatch) -> None:
+    calls = []
+
+    def refuse(*_a, **_k):
+        calls.append(1)
+        raise OSError("refused")
+
+    monkeypatch.setattr(doctor_module.socket, "getaddrinfo", refuse)
+    assert proxy_listening("localhost", 1235) is False
+    assert proxy_listening("localhost", 1235) is False
+    assert len(calls) == 1
+    assert proxy_listening("localhost", 1235, force=True) is False
+    assert len(calls) == 2
+
+
+def test_proxy_listening_hostname_uses_loopback_timeout(monkeypatch) -> None:
+    timeouts: list[float] = []
+
+    class FakeSocket:
+        def __init__(self, family, _type):
+            self.family = family
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return None
+
+        def settimeout(self, value):
+            timeouts.append(value)
+
+        def connect_ex(self, _addr):
+            return 111
+
+    infos = [
+        (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("::1", 1236, 0, 0)),
+        (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", 1236)),
+    ]
+    monkeypatch.setattr(proxy_utils.socket, "getaddrinfo", lambda *_a, **_k: infos)
+    monkeypatch.setattr(proxy_utils.socket, "socket", FakeSocket)
+    assert proxy_listening("localhost", 1236, force=True) is False
+    assert timeouts == [proxy_utils.LOOPBACK_PROBE_TIMEOUT_SECONDS] * 2
+
+
+def test_state_log_dir_created_once(tmp_path: Path, monkeypatch) -> None:
+    config = _make_config(tmp_path)
+    log_dir = proxy_utils.state_log_dir(config)
+    assert log_dir == tmp_path / "logs"
+    assert log_dir.is_dir()
+
+    def fail_mkdir(*_a, **_k):
+        raise AssertionError("mkdir should be cached")
+
+    monkeypatch.setattr(Path, "mkdir", fail_mkdir)
+    assert proxy_utils.proxy_daemon_log_path(config) == tmp_path / "logs" / "proxy.out"
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import os
+import threading
 from types import SimpleNamespace
 
 import httpx
 
 from kmi_manager_cli import health as health_module
+from kmi_manager_cli.keys import KeyRecord, Registry
 
 
 def test_window_hours_variants() -> None:
@@ -66,6 +69,20 @@ def test_extract_usage_summary_from_usage() -> None:
     assert reset_hint == "soon"
 
 
+def test_extract_usage_summary_reuses_parsed_limits() -> None:
+    payloads = [
+        {"limits": [{"detail": {"used": 10, "limit": 100, "reset_in": 60}}]},
+        {"usage": {"used": 1}, "limits": [{"used": 3, "limit": 4, "remaining": 1}]},
+        {"limits": ["bad", {"detail": {"used": 1, "limit": 2, "remaining": 1}}]},
+        {"limits": [{}]},
+    ]
+    for payload in payloads:
+        parsed = health_module._parse_limits(payload)
+        assert health_module._extract_usage_summary(
+            payload, parsed
+        ) == health_module._extract_usage_summary(payload)
+
+
 def test_parse_limits_skips_non_dict() -> None:
     payload = {"limits": ["bad", {"detail": {"used": 1, "limit": 2, "remaining": 1}}]}
     limits = health_module._parse_limits(payload)
@@ -197,8 +214,9 @@ def test_get_accounts_health_force_real(monkeypatch, tmp_path) -> None:
     state = health_module.State()
     calls = {}
 
-    def fake_fetch_usage(base_url, api_key, dry_run, logger=None, label=None):
+    def fake_fetch_usage(base_url, api_key, dry_run, logger=None, label=None, client=None):
         calls["dry_run"] = dry_run
+        calls["client"] = client
         return health_module.Usage(
             remaining_percent=100.0,
             used=0,
@@ -212,9 +230,41 @@ def test_get_accounts_health_force_real(monkeypatch, tmp_path) -> None:
     monkeypatch.setattr(health_module, "fetch_usage", fake_fetch_usage)
     health = health_module.get_accounts_health(config, [account], state, force_real=True)
     assert calls["dry_run"] is False
+    assert calls["client"] is health_module.get_http_client()
     assert health["acc"].status == "healthy"
 
 
+def test_fetch_usage_uses_given_client(monkeypatch) -> None:
+    class DummyResponse:
+        content = b"{}"
+
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict:
+            return {"remaining_percent": 42}
+
+    class DummyClient:
+        def __init__(self) -> None:
+            self.urls: list[str] = []
+
+        def get(self, url, **_kwargs):
+            self.urls.append(url)
+            return DummyResponse()
+
+    def fail_get(*_a, **_k):
+        raise AssertionError("module-level httpx.get should not be used")
+
+    monkeypatch.setattr(httpx, "get", fail_get)
+    client = DummyClient()
+    usage = health_module.fetch_usage(
+        "https://example.com/", "sk-test", dry_run=False, client=client
+    )
+    assert usage is not None
+    assert usage.remaining_percent == 42
+    assert client.urls == ["https://example.com/usages"]
+
+
 def test_looks_like_email_rejects_invalid() -> None:
     assert health_module._looks_like_email(123) is None
     assert health_module._looks_like_email("no-at-symbol") is None
@@ -289,3 +339,124 @@ def test_score_key_blocks_when_remaining_zero() -> None:
     )
     key_state = health_module.KeyState()
     assert health_module.score_key(usage, key_state, exhausted=False, blocked=False) == "blocked"
+
+
+def test_get_accounts_health_fetches_concurrently(monkeypatch, make_config) -> None:
+    accounts = [
+        health_module.Account(
+            id=f"acc-{label}",
+            label=label,
+            api_key=f"sk-{label}",
+            base_url="https://example.com",
+            source=f"{label}.env",
+        )
+        for label in ("alpha", "bravo", "charlie")
+    ]
+    barrier = threading.Barrier(len(accounts), timeout=5)
+
+    def fake_fetch_usage(base_url, api_key, dry_run, logger=None, label=None, client=None):
+        barrier.wait()  # only passes if all three fetches are in flight together
+        percent = {"alpha": 90.0, "bravo": 10.0, "charlie": 50.0}[label]
+        return health_module.Usage(
+            remaining_percent=percent,
+            used=None,
+            limit=None,
+            remaining=None,
+            reset_hint=None,
+            raw={},
+        )
+
+    monkeypatch.setattr(health_module, "fetch_usage", fake_fetch_usage)
+    health = health_module.get_accounts_health(
+        make_config(dry_run=False), accounts, health_module.State(), client=object()
+    )
+    assert list(health) == ["acc-alpha", "acc-bravo", "acc-charlie"]
+    assert [info.remaining_percent for info in health.values()] == [90.0, 10.0, 50.0]
+
+
+def test_get_accounts_health_reuses_cached_usage(monkeypatch, make_config) -> None:
+    config = make_config(dry_run=False)
+    account = health_module.Account(
+        id="acc",
+        label="alpha",
+        api_key="sk-alpha",
+        base_url="https://example.com",
+        source="alpha.env",
+    )
+    calls: list[str] = []
+
+    def fake_fetch_usage(base_url, api_key, dry_run, logger=None, label=None, client=None):
+        calls.append(api_key)
+        limit = health_module.LimitInfo(
+            label="5h limit", used=5, limit=10, remaining=5, reset_hint=None, window_hours=5.0
+        )
+        return health_module.Usage(
+            remaining_percent=50.0,
+            used=5,
+            limit=10,
+            remaining=5,
+            reset_hint=None,
+            raw={},
+            limits=[limit],
+        )
+
+    monkeypatch.setattr(health_module, "fetch_usage", fake_fetch_usage)
+    state = health_module.State()
+    first = health_module.get_accounts_health(config, [account], state, client=object(), cache_ttl=60)
+    second = health_module.get_accounts_health(config, [account], state, client=object(), cache_ttl=60)
+    assert calls == ["sk-alpha"]
+    assert second["acc"].remaining_percent == first["acc"].remaining_percent == 50.0
+    assert second["acc"].limits == first["acc"].limits
+    assert "sk-alpha" not in health_module.usage_cache_path(config).read_text(encoding="utf-8")
+    if os.name != "nt":
+        assert health_module.usage_cache_path(config).stat().st_mode & 0o777 == 0o600
+
+    rotated = health_module.Account(
+        id="acc",
+        label="alpha",
+        api_key="sk-rotated",
+        base_url="https://example.com",
+        source="alpha.env",
+    )
+    health_module.get_accounts_health(config, [rotated], state, client=object(), cache_ttl=60)
+    health_module.get_accounts_health(config, [rotated], state, client=object(), cache_ttl=0)
+    assert calls == ["sk-alpha", "sk-rotated", "sk-rotated"]
+
+
+def test_health_views_share_cached_usage_per_key(monkeypatch, make_config) -> None:
+    config = make_config(dry_run=False, upstream_base_url="https://example.com")
+    accounts = [
+        health_module.Account(
+            id=f"acc-{label}",
+            label=label,
+            api_key=f"sk-{label}",
+            base_url="https://example.com",
+            source=f"{label}.env",
+        )
+        for label in ("alpha", "bravo")
+    ]
+    calls: list[str] = []
+
+    def fake_fetch_usage(base_url, api_key, dry_run, logger=None, label=None, client=None):
+        calls.append(api_key)
+        if api_key == "sk-bravo" and calls.count(api_key) == 1:
+            return None
+        return health_module.Usage(
+            remaining_percent=40.0, used=6, limit=10, remaining=4, reset_hint=None, raw={}
+        )
+
+    monkeypatch.setattr(health_module, "fetch_usage", fake_fetch_usage)
+    state = health_module.State()
+    health_module.get_accounts_health(config, accounts, state, client=object(), cache_ttl=60)
+    registry = Registry(
+        keys=[
+            KeyRecord(label="alpha", api_key="sk-alpha"),
+            KeyRecord(label="bravo", api_key="sk-bravo"),
+        ]
+    )
+    health = health_module.get_health_map(
+        config, registry, state, client=object(), cache_ttl=60
+    )
+    # alpha comes from the cache; bravo failed before, so only it is refetched.
+    assert sorted(calls) == ["sk-alpha", "sk-bravo", "sk-bravo"]
+    assert health["alpha"].remaining_percent == health["bravo"].remaining_percent == 40.0
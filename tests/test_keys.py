@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from types import SimpleNamespace
 
+import pytest
+
+from kmi_manager_cli import keys as keys_module
 from kmi_manager_cli.keys import load_auths_dir, mask_key
 
 
@@ -45,3 +50,61 @@ KMI_KEY_PRIORITY=1
 def test_mask_key() -> None:
     assert mask_key("short") == "*****"
     assert mask_key("sk-1234567890") == "sk-1***7890"
+
+
+def test_load_auths_dir_reparses_env_only_when_changed(
+    tmp_path: Path, monkeypatch
+) -> None:
+    path = tmp_path / "a.env"
+    _write_env(path, "KMI_API_KEY=sk-test-a\nKMI_KEY_PRIORITY=1\n")
+    parsed: list[Path] = []
+    real_load = keys_module.read_env_values
+
+    def counting_load(env_path: Path) -> dict[str, str]:
+        parsed.append(env_path)
+        return real_load(env_path)
+
+    monkeypatch.setattr(keys_module, "read_env_values", counting_load)
+    assert load_auths_dir(tmp_path).keys[0].priority == 1
+    assert load_auths_dir(tmp_path).keys[0].priority == 1
+    assert parsed == [path]
+
+    _write_env(path, "KMI_API_KEY=sk-test-a\nKMI_KEY_PRIORITY=7\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_auths_dir(tmp_path).keys[0].priority == 7
+    assert parsed == [path, path]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+def test_load_auths_dir_warns_on_insecure_files_every_load(tmp_path: Path) -> None:
+    path = tmp_path / "a.env"
+    _write_env(path, "KMI_API_KEY=sk-test-a\n")
+    path.chmod(0o644)
+    warnings: list[str] = []
+    logger = SimpleNamespace(warning=lambda msg, **_kwargs: warnings.append(msg))
+
+    load_auths_dir(tmp_path)
+    load_auths_dir(tmp_path, logger=logger)
+    load_auths_dir(tmp_path, logger=logger)
+    assert warnings == ["insecure_permissions", "insecure_permissions"]
+
+
+def test_load_auths_dir_env_meta_handles_quotes_and_export(tmp_path: Path) -> None:
+    _write_env(
+        tmp_path / "a.env",
+        "# comment\nexport KMI_API_KEY=sk-test-a\nKMI_KEY_PRIORITY='3'\n"
+        "KMI_KEY_DISABLED=yes # paused\n",
+    )
+    key = load_auths_dir(tmp_path).keys[0]
+    assert key.priority == 3
+    assert key.disabled is True
+
+    _write_env(
+        tmp_path / "b.env",
+        'KMI_API_KEY=sk-test-b\nKMI_KEY_PRIORITY="5" # main\nKMI_KEY_DISABLED="no"#on\n',
+    )
+    key = load_auths_dir(tmp_path).keys[0]
+    assert key.api_key == "sk-test-b"
+    assert key.priority == 5
+    assert key.disabled is False
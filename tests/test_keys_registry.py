@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
+from kmi_manager_cli import keys as keys_module
 from kmi_manager_cli.keys import KeyRecord, Registry, iter_masked_keys, load_auths_dir
 
 
@@ -94,3 +96,32 @@ def test_load_auths_dir_invalid_priority(tmp_path: Path) -> None:
     )
     registry = load_auths_dir(auths_dir, default_base_url="https://example.com")
     assert registry.keys[0].priority == 0
+
+
+def test_key_hash_computed_on_first_use(monkeypatch) -> None:
+    keys_module._key_hash.cache_clear()
+    calls: list[bytes] = []
+    real_sha256 = hashlib.sha256
+
+    def counting_sha256(data: bytes):
+        calls.append(data)
+        return real_sha256(data)
+
+    monkeypatch.setattr(keys_module.hashlib, "sha256", counting_sha256)
+    record = KeyRecord(label="a", api_key="sk-lazy")
+    assert calls == []
+    expected = real_sha256(b"sk-lazy").hexdigest()[:12]
+    assert record.key_hash == expected
+    assert KeyRecord(label="b", api_key="sk-lazy").key_hash == expected
+    assert calls == [b"sk-lazy"]
+
+
+def test_registry_find_by_label_first_record_wins() -> None:
+    registry = Registry(
+        keys=[
+            KeyRecord(label="dup", api_key="sk-1"),
+            KeyRecord(label="dup", api_key="sk-2"),
+        ]
+    )
+    assert registry.find_by_label("dup").api_key == "sk-1"
+    assert registry == Registry(keys=list(registry.keys))
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import os
+import stat
 import threading
 import time
 from pathlib import Path
 
+import pytest
 
-from kmi_manager_cli.locking import atomic_write_text, file_lock, _lock_path
+from kmi_manager_cli.locking import (
+    atomic_write_private_text,
+    atomic_write_text,
+    file_lock,
+    _lock_path,
+)
 
 
 class TestLockPath:
@@ -60,6 +67,42 @@ class TestAtomicWriteText:
         assert path.read_text() == "complete content"
 
 
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+class TestAtomicWritePrivateText:
+    """Tests for atomic_write_private_text function."""
+
+    def test_file_is_owner_only_before_rename(self, monkeypatch, tmp_path: Path) -> None:
+        """Test that the content is never on disk with a looser mode."""
+        path = tmp_path / "cache" / "secret.json"
+        modes = []
+        orig_replace = os.replace
+
+        def spy_replace(src, dst):
+            modes.append(stat.S_IMODE(os.stat(src).st_mode))
+            orig_replace(src, dst)
+
+        monkeypatch.setattr(os, "replace", spy_replace)
+        old_umask = os.umask(0o022)
+        try:
+            atomic_write_private_text(path, "sk-secret")
+        finally:
+            os.umask(old_umask)
+        assert modes == [0o600]
+        assert path.read_text() == "sk-secret"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+
+    def test_tightens_stale_temp_file(self, tmp_path: Path) -> None:
+        """Test that a leftover loose temp file does not keep its mode."""
+        path = tmp_path / "secret.json"
+        stale = tmp_path / "secret.json.tmp"
+        stale.write_text("old")
+        stale.chmod(0o644)
+        atomic_write_private_text(path, "new")
+        assert path.read_text() == "new"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
 class TestFileLock:
     """Tests for file_lock context manager."""
 
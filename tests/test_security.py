@@ -12,6 +12,7 @@ import pytest
 from kmi_manager_cli.security import (
     _secure_mode,
     ensure_secure_permissions,
+    is_insecure_mode,
     is_insecure_permissions,
     warn_if_insecure,
 )
@@ -325,3 +326,20 @@ class TestEnsureSecurePermissions:
 
         ensure_secure_permissions(test_file, mock_logger, "test", is_dir=False, enforce=True)
         assert mock_logger.warning.call_count == 2
+
+
+class TestIsInsecureMode:
+    """Tests for is_insecure_mode function."""
+
+    def test_group_or_other_bits_are_insecure(self, monkeypatch) -> None:
+        """Test that any group/other bit is flagged, owner bits are not."""
+        monkeypatch.setattr(os, "name", "posix")
+        assert is_insecure_mode(stat.S_IFREG | 0o600) is False
+        assert is_insecure_mode(stat.S_IFDIR | 0o700) is False
+        assert is_insecure_mode(stat.S_IFREG | 0o640) is True
+        assert is_insecure_mode(stat.S_IFREG | 0o604) is True
+
+    def test_windows_always_secure(self, monkeypatch) -> None:
+        """Test that Windows modes are never flagged."""
+        monkeypatch.setattr(os, "name", "nt")
+        assert is_insecure_mode(0o777) is False